@@ -0,0 +1,525 @@
+# Benchmarks for the PyDSA data structures
+# Run all of them with `python benchmark.py` or pick some by name, e.g. `python benchmark.py array_storage`.
+
+import asyncio
+import collections
+import math
+import os
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import my_array
+import my_queue
+import stack
+
+
+# 🎁 Helper functions
+def timed(func, *args, **kwargs):
+    """
+    Runs func once & returns the elapsed wall-clock time in seconds
+    """
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def types_of(value):
+    """
+    Returns the types inside a (possibly nested) result, for comparing results of different storages beyond ==
+    """
+    if isinstance(value, (list, tuple)):
+        return [types_of(item) for item in value]
+    return type(value)
+
+
+def report(label, seconds, count=None):
+    """
+    Prints a single benchmark result line
+    """
+    rate = f" ({count / seconds:,.0f} ops/s)" if count else ""
+    print(f"🔹 {label:<40} {seconds:8.3f} s{rate}")
+
+
+
+# 🟥 =====> Array storage engines (list vs compact) <=====
+def array_storage(n=1_000_000):
+    print(f"\n📊 Array storage engines, {n:,} int elements")
+    values = [random.randrange(-2**40, 2**40) for _ in range(n)]
+
+    for storage in ("list", "compact"):
+        # The element objects have to be created while tracing, otherwise the list storage only gets charged for its pointers
+        tracemalloc.start()
+        array = my_array.Array(n, int, 0, storage=storage)
+        for i, value in enumerate(values):
+            array.insert(i, value + 1)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"\n🗂️ {storage}: {memory / 2**20:,.1f} MiB ({memory / n:.1f} bytes/element)")
+        report("insert", timed(lambda: [array.insert(i, value) for i, value in enumerate(values)]), n)
+        report("get", timed(lambda: [array.get(i) for i in range(n)]), n)
+        report("linear_search (miss)", timed(array.linear_search, 2**41), n)
+        report("sort", timed(array.sort))
+
+
+
+
+# 🟥 =====> Array sorting algorithms vs Array.sort <=====
+def array_sorts(n=200_000):
+    print(f"\n📊 Array sorting algorithms, {n:,} int elements")
+    inputs = {
+        "random": [random.randrange(-2**31, 2**31) for _ in range(n)],
+        "sorted": list(range(n)),
+        "few distinct": [random.randrange(100) for _ in range(n)],
+    }
+    algorithms = ("sort", "merge_sort", "intro_sort", "radix_sort", "counting_sort")
+
+    for label, values in inputs.items():
+        print(f"\n🗂️ {label}")
+        for algorithm in algorithms:
+            # Counting sort only pays off on a small value range
+            if algorithm == "counting_sort" and label == "random":
+                continue
+            array = my_array.Array.from_iterable(values, int, storage="compact")
+            method = getattr(array, algorithm)
+            seconds = timed(method) if algorithm == "sort" else timed(method, "asc")
+            report(algorithm, seconds, n)
+
+
+
+# 🟥 =====> Array batch search strategies <=====
+def array_search_many(n=200_000):
+    print(f"\n📊 Array.search_many strategies, {n:,} int elements, half of the targets missing")
+    array = my_array.Array.from_iterable((random.randrange(2 * n) for _ in range(n)), int, storage="compact")
+    # The sorted index is built once up front, the way repeated lookups against the same array see it
+    report("sorted index build", timed(array.binary_search, -1), n)
+
+    for ratio in (0.0001, 0.01, 1, 10):
+        m = max(1, int(n * ratio))
+        targets = [random.randrange(2 * n) for _ in range(m)]
+        print(f"\n🗂️ {m:,} targets ({ratio:g} × n)")
+        for strategy in (None, "hash", "merge", "bisect"):
+            report(strategy or "auto", timed(array.search_many, targets, strategy), m)
+        # One search per call, for reference
+        if m <= 10_000:
+            report("binary_search × m", timed(lambda: [array.binary_search(target) for target in targets]), m)
+
+
+
+# 🟥 =====> Array bulk loading vs one insert per element <=====
+def array_bulk_load(n=1_000_000):
+    print(f"\n📊 Array bulk loading, {n:,} int elements")
+    values = [random.randrange(-2**40, 2**40) for _ in range(n)]
+    path = os.path.join(tempfile.gettempdir(), "pydsa_bulk_load.bin")
+
+    for storage in ("list", "compact"):
+        print(f"\n🗂️ {storage}")
+        array = my_array.Array(n, int, 0, storage=storage)
+        report("insert × n", timed(lambda: [array.insert(i, value) for i, value in enumerate(values)]), n)
+        report("extend_into", timed(array.extend_into, 0, values), n)
+        report("slice assignment", timed(array.__setitem__, slice(None), values), n)
+        report("from_iterable", timed(my_array.Array.from_iterable, values, int, storage=storage), n)
+        array.tofile(path)
+        report("from_file", timed(my_array.Array.from_file, path, int, storage=storage), n)
+    os.remove(path)
+
+
+
+# 🟥 =====> External sort of a memory-mapped Array <=====
+def array_external_sort(n=2_000_000):
+    print(f"\n📊 External sort of a MappedArray, {n:,} int elements ({n * 8 / 2**20:,.0f} MiB)")
+    path = os.path.join(tempfile.gettempdir(), "pydsa_external_sort.bin")
+    values = [random.randrange(-2**40, 2**40) for _ in range(n)]
+
+    for budget in (n * 8, n * 8 // 8, n * 8 // 64):
+        with my_array.MappedArray(path, int, n) as array:
+            array.extend_into(0, values)
+            seconds = timed(array.external_sort, "asc", memory_budget=budget)
+        report(f"budget {budget / 2**20:,.2f} MiB ({-(-n * 8 // budget)} runs)", seconds, n)
+    os.remove(path)
+
+
+
+# 🟥 =====> Parallel sort scaling over the cores <=====
+def array_parallel_sort(n=10_000_000):
+    cores = os.cpu_count() or 1
+    print(f"\n📊 Array.parallel_sort scaling, {n:,} int elements, 1-{cores} workers")
+    values = my_array.Array.from_iterable((random.randrange(-2**40, 2**40) for _ in range(n)), int, storage="compact").array
+    baseline = None
+
+    for workers in range(1, cores + 1):
+        array = my_array.Array.from_iterable(values, int, storage="compact")
+        seconds = timed(array.parallel_sort, "asc", workers)
+        baseline = baseline or seconds
+        report(f"{workers} worker(s), speedup {baseline / seconds:.2f}×", seconds, n)
+
+
+
+# 🟥 =====> Selection & partial sorting vs full sorting <=====
+def array_selection(n=1_000_000):
+    print(f"\n📊 Array selection & partial sorting, {n:,} int elements")
+    values = my_array.Array.from_iterable((random.randrange(-2**40, 2**40) for _ in range(n)), int, storage="compact").array
+
+    def fresh():
+        return my_array.Array.from_iterable(values, int, storage="compact")
+
+    report("sort (full)", timed(fresh().sort), n)
+    report("intro_sort (full)", timed(fresh().intro_sort, "asc"), n)
+    report("select (median)", timed(fresh().select, n // 2), n)
+    for k in (10, 1_000, 100_000):
+        print(f"\n🗂️ k = {k:,}")
+        report("top_k", timed(fresh().top_k, k), n)
+        report("partial_sort", timed(fresh().partial_sort, k), n)
+
+
+
+# 🟥 =====> NumPy storage: parity with the pure-Python storages & speed <=====
+def array_numpy(n=1_000_000):
+    if my_array.numpy is None:
+        print("\n📊 NumPy isn't installed; skipping the NumPy storage benchmark")
+        return
+    print(f"\n📊 Array NumPy storage vs compact, {n:,} elements")
+
+    for data_type, make in ((int, lambda: random.randrange(-2**40, 2**40)), (float, lambda: random.uniform(-1e6, 1e6))):
+        values = [make() for _ in range(n)]
+        targets = values[:100] + [make() for _ in range(100)]
+        print(f"\n🗂️ {data_type.__name__}")
+
+        results = {}
+        for storage in ("compact", "numpy"):
+            array = my_array.Array.from_iterable(values, data_type, storage=storage)
+            outcome = {}
+
+            def run(label, operation, count):
+                start = time.perf_counter()
+                outcome[label] = operation()
+                report(f"{storage} {label}", time.perf_counter() - start, count)
+
+            run("linear_search × 10", lambda: [array.linear_search(target) for target in targets[95:105]], 10)
+            run("binary_search × 200", lambda: [array.binary_search(target) for target in targets], 200)
+            run("search_many (200 targets)", lambda: array.search_many(targets).tolist(), 200)
+            run("extend_into", lambda: array.extend_into(0, values), n)
+            run("sum", array.sum, n)
+            run("min/max", lambda: (array.min(), array.max()), n)
+            run("get/[]/select", lambda: (array.get(0), array[-1], array.select(n // 2)), n)
+            run("sort", lambda: (array.sort(), array.tolist())[1], n)
+            results[storage] = outcome
+
+        # Parity: both storages have to give the same answers (float sums only up to rounding, NumPy adds pairwise), as the same Python types
+        for label, expected in results["compact"].items():
+            actual = results["numpy"][label]
+            same = math.isclose(actual, expected, rel_tol=1e-9) if label == "sum" else actual == expected
+            assert same, f"numpy storage disagrees on {label}"
+            assert types_of(actual) == types_of(expected), f"numpy storage returns other types for {label}"
+        # An ndarray loaded into another storage has to end up as that storage's own values
+        loaded = my_array.Array.from_iterable(my_array.numpy.array(values[:10]), data_type)
+        assert type(loaded.array) is list and types_of(loaded.array) == types_of(values[:10]), "ndarray leaked into list storage"
+        print("✅ Identical results on both storages")
+
+    # Keys spanning more than the int64 range between their minimum & maximum, which the int sorts must offset without wrapping around
+    wide = [-2**62, 2**62, 5, -3, 2**63 - 1, -2**63]
+    for algorithm in ("radix_sort", "counting_sort"):
+        for storage in ("compact", "numpy"):
+            array = my_array.Array.from_iterable(wide, int, storage=storage)
+            getattr(array, algorithm)("asc")
+            assert array.tolist() == sorted(wide), f"{storage} {algorithm} disagrees on a wide key range"
+    print("✅ Wide key ranges sorted identically on both storages")
+
+
+
+# 🟥 =====> Range queries: indexes vs scanning the range <=====
+def array_range_queries(n=1_000_000, queries=10_000):
+    print(f"\n📊 Array range queries, {n:,} int elements, {queries:,} random ranges")
+    array = my_array.Array.from_iterable((random.randrange(-2**20, 2**20) for _ in range(n)), int, storage="compact")
+    ranges = [sorted(random.sample(range(n + 1), 2)) for _ in range(queries)]
+    ranges = [(l, r) for l, r in ranges if l < r]
+
+    report("scan: sum(array[l:r])", timed(lambda: [sum(array.array[l:r]) for l, r in ranges[:100]]), 100)
+    report("scan: min(array[l:r])", timed(lambda: [min(array.array[l:r]) for l, r in ranges[:100]]), 100)
+    report("Fenwick build", timed(array.range_sum, 0, 0), n)
+    report("range_sum", timed(lambda: [array.range_sum(l, r) for l, r in ranges]), len(ranges))
+
+    for mode in ("dynamic", "static"):
+        array.range_mode = mode
+        print(f"\n🗂️ {mode}")
+        report("build", timed(array.range_min, 0, 1), n)
+        report("range_min", timed(lambda: [array.range_min(l, r) for l, r in ranges]), len(ranges))
+        # A static sparse table is rebuilt by the first query after a write
+        report("insert + range_min", timed(lambda: [(array.insert(l, random.randrange(2**20)), array.range_min(l, r)) for l, r in ranges[:5]]), 5)
+
+
+
+# 🟥 =====> DynamicArray growth factors <=====
+def dynamic_array_growth(n=1_000_000):
+    print(f"\n📊 DynamicArray appends, {n:,} int elements")
+    report("list.append (reference)", timed(_append_all, [], n), n)
+
+    for storage in ("list", "compact"):
+        print(f"\n🗂️ {storage}")
+        for factor in (1.25, 1.5, 2, 3):
+            array = my_array.DynamicArray(int, capacity=1, growth_factor=factor, storage=storage)
+            seconds = timed(_append_all, array, n)
+            report(f"growth factor {factor}", seconds, n)
+            print(f"   {array.reallocations} reallocations, {array.copied / n:.2f} copies per element, {array.size / n - 1:.0%} unused capacity")
+
+
+def _append_all(target, n):
+    append = target.append
+    for i in range(n):
+        append(i)
+
+
+
+# 🟥 =====> Stack contention: ThreadSafeStack vs a Stack behind a plain lock <=====
+def stack_contention(ops=200_000, batch=32):
+    print(f"\n📊 Shared stack as a free list, {ops:,} pop+push pairs split over the threads")
+
+    def locked_stack(shared, lock, count):
+        for _ in range(count):
+            with lock:
+                item = shared.pop()
+            with lock:
+                shared.push(item)
+
+    def thread_safe_stack(shared, lock, count):
+        for _ in range(count):
+            shared.push(shared.pop())
+
+    def thread_safe_batches(shared, lock, count):
+        for _ in range(count // batch):
+            shared.push_many(shared.pop_many(batch))
+
+    for threads in (1, 2, 4, 8, 16):
+        print(f"\n🗂️ {threads} thread(s)")
+        for label, worker, kind in (("Stack + threading.Lock", locked_stack, stack.Stack),
+                                    ("ThreadSafeStack", thread_safe_stack, stack.ThreadSafeStack),
+                                    (f"ThreadSafeStack, batches of {batch}", thread_safe_batches, stack.ThreadSafeStack)):
+            # Every thread holds at most one batch, so the free list never runs dry
+            shared = kind(threads * batch)
+            for item in range(threads * batch):
+                shared.push(item)
+            lock = threading.Lock()
+            workers = [threading.Thread(target=worker, args=(shared, lock, ops // threads)) for _ in range(threads)]
+            start = time.perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            report(label, time.perf_counter() - start, ops)
+
+
+
+# 🟥 =====> Stack memory: list of objects vs CompactStack <=====
+def stack_memory(n=1_000_000):
+    print(f"\n📊 Stack memory & speed, {n:,} int elements")
+    values = [random.randrange(-2**40, 2**40) for _ in range(n)]
+
+    for kind in (stack.Stack, stack.CompactStack):
+        # The element objects have to be created while tracing, otherwise the list only gets charged for its pointers
+        tracemalloc.start()
+        shared = kind(n)
+        for value in values:
+            shared.push(value + 1)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"\n🗂️ {kind.__name__}: {memory / 2**20:,.1f} MiB ({memory / n:.1f} bytes/element)")
+        report("pop", timed(lambda: [shared.pop() for _ in range(n)]), n)
+        report("push", timed(lambda: [shared.push(value) for value in values]), n)
+
+
+
+# 🟥 =====> AsyncStack vs asyncio.LifoQueue under producer/consumer load <=====
+def stack_async(items=100_000, producers=4, consumers=4, size=64):
+    print(f"\n📊 Async LIFO, {items:,} items, {producers} producers, {consumers} consumers, capacity {size}")
+
+    async def run(push, pop):
+        latencies = []
+
+        async def produce(count):
+            for _ in range(count):
+                await push(time.perf_counter())
+
+        async def consume(count):
+            for _ in range(count):
+                latencies.append(time.perf_counter() - await pop())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(produce(items // producers) for _ in range(producers)),
+                             *(consume(items // consumers) for _ in range(consumers)))
+        return time.perf_counter() - start, sorted(latencies)
+
+    for label, make in (("AsyncStack", lambda: stack.AsyncStack(size)), ("asyncio.LifoQueue", lambda: asyncio.LifoQueue(size))):
+        shared = make()
+        push, pop = (shared.push, shared.pop) if isinstance(shared, stack.AsyncStack) else (shared.put, shared.get)
+        seconds, latencies = asyncio.run(run(push, pop))
+        report(label, seconds, len(latencies))
+        print(f"   latency: median {latencies[len(latencies) // 2] * 1e6:,.0f} µs, p99 {latencies[len(latencies) * 99 // 100] * 1e6:,.0f} µs")
+
+
+
+# 🟥 =====> SpillStack: bounded memory for very deep stacks <=====
+def stack_spill(n=1_000_000, resident=10_000, page_size=2_000):
+    print(f"\n📊 Deep stack, {n:,} tuples pushed then popped")
+
+    def push_all(shared):
+        for i in range(n):
+            shared.push((i, i))
+
+    def pop_all(shared):
+        for _ in range(n):
+            shared.pop()
+
+    for label, make in (("Stack", lambda: stack.Stack(n)),
+                        (f"SpillStack ({resident:,} resident, pages of {page_size:,})", lambda: stack.SpillStack(n, resident, page_size))):
+        shared = make()
+        # Tracing slows everything down, so the timings are taken on a second round
+        tracemalloc.start()
+        push_all(shared)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        pop_all(shared)
+        print(f"\n🗂️ {label}: peak {peak / 2**20:,.1f} MiB")
+        report("push", timed(push_all, shared), n)
+        report("pop", timed(pop_all, shared), n)
+        if isinstance(shared, stack.SpillStack):
+            print(f"   {shared.spills:,} spills, {shared.reloads:,} reloads")
+            shared.close()
+
+
+
+# 🟥 =====> Stack snapshots: copying the list vs SnapshotStack <=====
+def stack_snapshots(n=100_000, snapshots=1_000):
+    print(f"\n📊 {snapshots:,} snapshots of a {n:,} item stack, one push between snapshots")
+
+    def copying(shared):
+        return [(shared.push(i), shared.stack[:])[1] for i in range(snapshots)]
+
+    def sharing(shared):
+        return [(shared.push(i), shared.snapshot())[1] for i in range(snapshots)]
+
+    for label, kind, take in (("Stack + list copy", stack.Stack, copying), ("SnapshotStack", stack.SnapshotStack, sharing)):
+        shared = kind(n + 2 * snapshots)
+        for i in range(n):
+            shared.push(i)
+        # Tracing slows everything down, so the timing is taken on a second round
+        tracemalloc.start()
+        kept = take(shared)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report(label, timed(take, shared), snapshots)
+        print(f"   {memory / len(kept):,.0f} bytes per snapshot")
+
+
+
+# 🟥 =====> GrowableQueue vs collections.deque <=====
+def queue_growable(n=1_000_000, batch=64):
+    print(f"\n📊 GrowableQueue vs collections.deque, {n:,} items")
+
+    def one_by_one(put, take):
+        for i in range(n):
+            put(i)
+        for _ in range(n):
+            take()
+
+    def batched(put_many, take_many):
+        for i in range(0, n, batch):
+            put_many(range(i, i + batch))
+        for _ in range(0, n, batch):
+            take_many(batch)
+
+    # A steady state: the queue stays short while items keep flowing through the ring
+    def churn(put, take):
+        for i in range(n):
+            put(i)
+            take()
+
+    ring = my_queue.GrowableQueue()
+    report("GrowableQueue enqueue/dequeue (growing)", timed(one_by_one, ring.enqueue, ring.dequeue), 2 * n)
+    print(f"   {ring.reallocations} reallocations, capacity {ring.size:,}")
+    report("GrowableQueue enqueue/dequeue (steady)", timed(churn, ring.enqueue, ring.dequeue), 2 * n)
+    report(f"GrowableQueue *_many (batch {batch})", timed(batched, ring.enqueue_many, ring.dequeue_many), 2 * n)
+
+    line = collections.deque()
+    report("deque append/popleft (growing)", timed(one_by_one, line.append, line.popleft), 2 * n)
+    report("deque append/popleft (steady)", timed(churn, line.append, line.popleft), 2 * n)
+    report(f"deque extend/popleft (batch {batch})", timed(batched, line.extend, lambda count: [line.popleft() for _ in range(count)]), 2 * n)
+
+
+
+# 🟥 =====> BlockingQueue vs queue.Queue: throughput & tail latency between threads <=====
+def queue_blocking(items=200_000, producers=4, consumers=4, size=1_024, batch=64):
+    print(f"\n📊 {items:,} items through a {size:,} slot queue, {producers} producer & {consumers} consumer threads")
+
+    def run(shared, take):
+        latencies = []
+
+        # Every item is its enqueue time, so the consumer can measure how long it waited in the queue
+        def produce():
+            for _ in range(items // producers):
+                shared.put(time.perf_counter())
+
+        # A single None marks the end; whoever finds it puts it back for the other consumers
+        def consume():
+            mine = []
+            while True:
+                for item in take():
+                    if item is None:
+                        shared.put(None)
+                        latencies.extend(mine)
+                        return
+                    mine.append(time.perf_counter() - item)
+
+        threads = [threading.Thread(target=consume) for _ in range(consumers)]
+        threads += [threading.Thread(target=produce) for _ in range(producers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads[consumers:]:
+            thread.join()
+        shared.put(None)
+        for thread in threads[:consumers]:
+            thread.join()
+        return time.perf_counter() - start, sorted(latencies)
+
+    stdlib, ring, batched = queue.Queue(size), my_queue.BlockingQueue(size), my_queue.BlockingQueue(size)
+    for label, shared, take in (
+        ("queue.Queue get", stdlib, lambda: (stdlib.get(),)),
+        ("BlockingQueue get", ring, lambda: (ring.get(),)),
+        (f"BlockingQueue get_batch({batch})", batched, lambda: batched.get_batch(batch)),
+    ):
+        seconds, latencies = run(shared, take)
+        report(label, seconds, len(latencies))
+        p50, p99 = (latencies[int(len(latencies) * q)] * 1e6 for q in (0.5, 0.99))
+        print(f"   latency p50 {p50:,.0f} µs, p99 {p99:,.0f} µs, max {latencies[-1] * 1e6:,.0f} µs")
+
+
+
+BENCHMARKS = {
+    "array_storage": array_storage,
+    "array_sorts": array_sorts,
+    "array_search_many": array_search_many,
+    "array_bulk_load": array_bulk_load,
+    "array_external_sort": array_external_sort,
+    "array_parallel_sort": array_parallel_sort,
+    "array_selection": array_selection,
+    "array_numpy": array_numpy,
+    "array_range_queries": array_range_queries,
+    "dynamic_array_growth": dynamic_array_growth,
+    "stack_contention": stack_contention,
+    "stack_memory": stack_memory,
+    "stack_async": stack_async,
+    "stack_spill": stack_spill,
+    "stack_snapshots": stack_snapshots,
+    "queue_growable": queue_growable,
+    "queue_blocking": queue_blocking,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -7,11 +7,12 @@ import utility
 # 🟥 =====> Adjacency Matrix Directed Weighted Graph <=====
 
 # 🎯 The Adjacency Matrix class
-class MatrixDirectedWeightedGraph:
-    def __init__(self, num_vertices):
+class MatrixDirectedWeightedGraph(utility.Observable):
+    def __init__(self, num_vertices, observer=None):
         """
         Initializes the graph with a given number of vertices
         """
+        self.observer = observer
         self.num_vertices = num_vertices
         # Create an adjacency matrix initialized to 0
         self.adj_matrix = [[0] * num_vertices for _ in range(num_vertices)]
@@ -21,18 +22,18 @@ class MatrixDirectedWeightedGraph:
         if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
             # Add a directed edge from vertex u to vertex v with the given weight
             self.adj_matrix[u][v] = weight
-            print(f"\n✅ Edge addition successful. Edge added from vertex {u} to {v} with weight {weight}.")
+            self.notify(f"\n✅ Edge addition successful. Edge added from vertex {u} to {v} with weight {weight}.")
         else:
-            print(f"\n🚫 Edge addition unsuccessful. Invalid vertices: {u}, {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
+            self.fail(IndexError(f"Invalid vertices: {u}, {v}"), f"\n🚫 Edge addition unsuccessful. Invalid vertices: {u}, {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
 
     def remove_edge(self, u, v):
         # Check if u and v are within the valid range of vertices
         if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
             # Remove the edge from vertex u to vertex v by setting the weight to 0
             self.adj_matrix[u][v] = 0
-            print(f"\n✅ Edge removal successful. Edge removed from vertex {u} to {v}.")
+            self.notify(f"\n✅ Edge removal successful. Edge removed from vertex {u} to {v}.")
         else:
-            print(f"\n🚫 Edge removal unsuccessful. Invalid vertices: {u}, {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
+            self.fail(IndexError(f"Invalid vertices: {u}, {v}"), f"\n🚫 Edge removal unsuccessful. Invalid vertices: {u}, {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
 
     def add_vertex(self):
         # Increment the number of vertices
@@ -42,7 +43,8 @@ class MatrixDirectedWeightedGraph:
             row.append(0)
         # Add a new column at the end of each existing row, also initialized to 0
         self.adj_matrix.append([0] * self.num_vertices)
-        print(f"\n✅ Vertex addition successful. Vertex {self.num_vertices - 1} added.")
+        self.notify(f"\n✅ Vertex addition successful. Vertex {self.num_vertices - 1} added.")
+        return self.num_vertices - 1
 
     def remove_vertex(self, v):
         # Check if the vertex is within the valid range
@@ -54,30 +56,33 @@ class MatrixDirectedWeightedGraph:
                 row.pop(v)
             # Decrement the number of vertices
             self.num_vertices -= 1
-            print(f"\n✅ Vertex removal successful. Vertex {v} removed.")
+            self.notify(f"\n✅ Vertex removal successful. Vertex {v} removed.")
         else:
-            print(f"\n🚫 Vertex removal unsuccessful. Invalid vertex: {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
+            self.fail(IndexError(f"Invalid vertex: {v}"), f"\n🚫 Vertex removal unsuccessful. Invalid vertex: {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
 
-    def dfs_util(self, v, visited):
-        # Mark the current node as visited and print it
+    def dfs_util(self, v, visited, order):
+        # Mark the current node as visited and record it
         visited[v] = True
-        print(v, end=' ')
+        order.append(v)
         
         # Recur for all the vertices adjacent to this vertex
         for i in range(self.num_vertices):
             if self.adj_matrix[v][i] != 0 and not visited[i]:
-                self.dfs_util(i, visited)
+                self.dfs_util(i, visited, order)
 
     def dfs(self, start_vertex):
         # Check if the vertex is within the valid range
         if 0 <= start_vertex < self.num_vertices:
             # Initialize all vertices as not visited
             visited = [False] * self.num_vertices
-            # Call the recursive helper function to print DFS traversal
-            self.dfs_util(start_vertex, visited)
-            print("\nℹ️ DFS Traversal") # Adds a newline & traversal type after the output
+            # Call the recursive helper function to collect the DFS traversal
+            order = []
+            self.dfs_util(start_vertex, visited, order)
+            self.notify("".join(f"{v} " for v in order), end="")
+            self.notify("\nℹ️ DFS Traversal") # Adds a newline & traversal type after the output
+            return order
         else:
-            print(f"\n🚫 DFS traversal unsuccessful. Invalid vertex: {start_vertex}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
+            self.fail(IndexError(f"Invalid vertex: {start_vertex}"), f"\n🚫 DFS traversal unsuccessful. Invalid vertex: {start_vertex}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
 
     def bfs(self, start_vertex):
         # Check if the vertex is within the valid range
@@ -89,11 +94,12 @@ class MatrixDirectedWeightedGraph:
             # Mark the start vertex as visited and enqueue it
             queue.append(start_vertex)
             visited[start_vertex] = True
+            order = []
     
             while queue:
                 # Dequeue a vertex from the queue
                 v = queue.pop(0)
-                print(v, end=' ')
+                order.append(v)
     
                 # Get all adjacent vertices of the dequeued vertex v
                 # If an adjacent vertex has not been visited, mark it visited and enqueue it
@@ -101,9 +107,11 @@ class MatrixDirectedWeightedGraph:
                     if self.adj_matrix[v][i] != 0 and not visited[i]:
                         queue.append(i)
                         visited[i] = True
-            print("\nℹ️ BFS Traversal") # Adds a newline & traversal type after the output
+            self.notify("".join(f"{v} " for v in order), end="")
+            self.notify("\nℹ️ BFS Traversal") # Adds a newline & traversal type after the output
+            return order
         else:
-            print(f"\n🚫 DFS traversal unsuccessful. Invalid vertex: {start_vertex}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
+            self.fail(IndexError(f"Invalid vertex: {start_vertex}"), f"\n🚫 BFS traversal unsuccessful. Invalid vertex: {start_vertex}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
 
     def search_edge(self, u, v):
         # Check if there is an edge from vertex u to vertex v
@@ -111,11 +119,13 @@ class MatrixDirectedWeightedGraph:
             result = self.adj_matrix[u][v] != 0
             if result is True:
                 weight = self.adj_matrix[u][v]
-                print(f"\n✅ Edge searching successful. Edge with weight {weight} found from vertex {u} to {v}.")
+                self.notify(f"\n✅ Edge searching successful. Edge with weight {weight} found from vertex {u} to {v}.")
+                return weight
             else:
-                print(f"\n❌ Edge searching successful. No edge found from vertex {u} to {v}.")
+                self.notify(f"\n❌ Edge searching successful. No edge found from vertex {u} to {v}.")
+                return None
         else:
-            print(f"\n🚫 Edge searching unsuccesful. Invalid vertices: {u}, {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
+            self.fail(IndexError(f"Invalid vertices: {u}, {v}"), f"\n🚫 Edge searching unsuccesful. Invalid vertices: {u}, {v}.\nValid vertices are in the range 0 to {self.num_vertices - 1}.")
     
     def display(self):
         total_rows = len(self.adj_matrix)
@@ -142,7 +152,7 @@ def adj_matrix_main():
                 while True:
                     num_vertices = utility.input_verify("int", "total number of vertices you want in the Adjacency Matrix")
                     if num_vertices != None:
-                        adj_matrix = MatrixDirectedWeightedGraph(num_vertices)
+                        adj_matrix = MatrixDirectedWeightedGraph(num_vertices, observer=print)
                         print(f"\n👇🏻 Here's your Adjacency Matrix with {num_vertices} vertices:")
                         adj_matrix.display()
                         print(f"\n⚠️ Keep in mind that the vertices are identified with integers in the range zero to number of vertices minus 1, which means 0 to {num_vertices - 1} as of now.")
@@ -154,7 +164,7 @@ def adj_matrix_main():
                       
             # Use example
             case "2":
-              adj_matrix = MatrixDirectedWeightedGraph(4)
+              adj_matrix = MatrixDirectedWeightedGraph(4, observer=print)
               # Directly populating the adj_matrix property of the object rather than using add_edge() in a bid to avoid the feedback print statements, as the vertices are identified by index, it's much like automatically adding edges.
               adj_matrix.adj_matrix = [[10,0,30,19], [17,22,37,0], [0,672,8,45], [0,0,0,0]]
               print("\n👇🏻 Here's an example Adjacency Matrix with 4 vertices:")
@@ -294,20 +304,21 @@ def adj_matrix_main():
 # 🟥 =====> Adjacency List Directed Weighted Graph <=====
 
 # 🎯 The Adjacency List class
-class ListDirectedWeightedGraph:
-    def __init__(self):
+class ListDirectedWeightedGraph(utility.Observable):
+    def __init__(self, observer=None):
+        self.observer = observer
         # Initialize the graph with an empty dictionary. This dictionary has each vertex as a key & a list of all (neighbor, weight) tuples the vertex connects to as the value.
         self.adj_list = {}
-        print("\n✅ Adjacency List successfully initialized.")
+        self.notify("\n✅ Adjacency List successfully initialized.")
 
     def add_vertex(self, vertex):
         # Add a vertex to the graph
         if vertex not in self.adj_list:
             # Adding the vertex as a key & initialzing an empty list as its value
             self.adj_list[vertex] = []
-            print(f"\n✅ Vertex addition successful. Vertex {vertex} added.")
+            self.notify(f"\n✅ Vertex addition successful. Vertex {vertex} added.")
         else:
-            print(f"\n🚫 Vertex addition unsuccessful Vertex {vertex} already exists.")
+            self.fail(ValueError(f"Vertex {vertex} already exists"), f"\n🚫 Vertex addition unsuccessful Vertex {vertex} already exists.")
 
     def remove_vertex(self, vertex):
         # Remove a vertex and all its edges
@@ -317,9 +328,9 @@ class ListDirectedWeightedGraph:
                 self.adj_list[u] = [edge for edge in self.adj_list[u] if edge[0] != vertex]
             # Remove the vertex itself
             del self.adj_list[vertex]
-            print(f"\n✅ Vertex removal successful. Vertex {vertex} removed.")
+            self.notify(f"\n✅ Vertex removal successful. Vertex {vertex} removed.")
         else:
-            print(f"\n🚫 Vertex removal unsuccessful. Vertex {vertex} does not exist.")
+            self.fail(KeyError(vertex), f"\n🚫 Vertex removal unsuccessful. Vertex {vertex} does not exist.")
 
     def add_edge(self, u, v, weight):
         # Add a directed edge from vertex u to vertex v with the given weight
@@ -329,58 +340,70 @@ class ListDirectedWeightedGraph:
                     self.adj_list[u].remove((neighbor, _weight))
                     break
             self.adj_list[u].append((v, weight))
-            print(f"\n✅ Edge addition successful. Edge added from {u} to {v} with weight {weight}.")
+            self.notify(f"\n✅ Edge addition successful. Edge added from {u} to {v} with weight {weight}.")
         else:
-            print(f"\n🚫 Edge addition unsuccessful. One or both vertices {u}, {v} do not exist.")
+            self.fail(KeyError(u if u not in self.adj_list else v), f"\n🚫 Edge addition unsuccessful. One or both vertices {u}, {v} do not exist.")
 
     def remove_edge(self, u, v):
         # Remove the edge from vertex u to vertex v
         if u in self.adj_list and v in self.adj_list:
             self.adj_list[u] = [edge for edge in self.adj_list[u] if edge[0] != v]
-            print(f"\n✅ Edge removal successful. Edge removed from {u} to {v}.")
+            self.notify(f"\n✅ Edge removal successful. Edge removed from {u} to {v}.")
         else:
-            print(f"\n🚫 Edge removal unsuccessful. One or both vertices {u}, {v} do not exist.")
+            self.fail(KeyError(u if u not in self.adj_list else v), f"\n🚫 Edge removal unsuccessful. One or both vertices {u}, {v} do not exist.")
 
-    def dfs_util(self, v, visited):
+    def dfs_util(self, v, visited, order):
         # Utility function for DFS traversal
         visited.add(v)
-        print(v, end=' ')
+        order.append(v)
         for neighbor, _ in self.adj_list[v]:
             if neighbor not in visited:
-                self.dfs_util(neighbor, visited)
+                self.dfs_util(neighbor, visited, order)
 
     def dfs(self, start_vertex):
         # Perform DFS traversal starting from the given vertex
+        if start_vertex not in self.adj_list:
+            self.fail(KeyError(start_vertex), f"\n🚫 DFS traversal unsuccessful. Vertex {start_vertex} does not exist.")
+            return
         visited = set()
-        self.dfs_util(start_vertex, visited)
-        print("\nℹ️ DFS Traversal") # Adds a newline & traversal type after the output
+        order = []
+        self.dfs_util(start_vertex, visited, order)
+        self.notify("".join(f"{v} " for v in order), end="")
+        self.notify("\nℹ️ DFS Traversal") # Adds a newline & traversal type after the output
+        return order
 
     def bfs(self, start_vertex):
         # Perform BFS traversal starting from the given vertex
+        if start_vertex not in self.adj_list:
+            self.fail(KeyError(start_vertex), f"\n🚫 BFS traversal unsuccessful. Vertex {start_vertex} does not exist.")
+            return
         visited = set()
         queue = [start_vertex]
         visited.add(start_vertex)
+        order = []
 
         while queue:
             v = queue.pop(0)
-            print(v, end=' ')
+            order.append(v)
             for neighbor, _ in self.adj_list[v]:
                 if neighbor not in visited:
                     queue.append(neighbor)
                     visited.add(neighbor)
-        print("\nℹ️ BFS Traversal") # Adds a newline & traversal type after the output
+        self.notify("".join(f"{v} " for v in order), end="")
+        self.notify("\nℹ️ BFS Traversal") # Adds a newline & traversal type after the output
+        return order
 
     def search_edge(self, u, v):
         # Check if there is an edge from vertex u to vertex v
         if u in self.adj_list:
             for neighbor, weight in self.adj_list[u]:
                 if neighbor == v:
-                    print(f"\n✅ Edge searching successful. Edge found from {u} to {v} with weight {weight}.")
-                    return True
-            print(f"\n❌ Edge searching successful. No edge found from {u} to {v}.")
-            return False
+                    self.notify(f"\n✅ Edge searching successful. Edge found from {u} to {v} with weight {weight}.")
+                    return weight
+            self.notify(f"\n❌ Edge searching successful. No edge found from {u} to {v}.")
+            return None
         else: 
-            print(f"\n🚫 Edge searching unsuccessful. Vertex {u} does not exist.")
+            self.fail(KeyError(u), f"\n🚫 Edge searching unsuccessful. Vertex {u} does not exist.")
 
     def display(self):
         for vertex in self.adj_list:
@@ -401,13 +424,13 @@ def adj_list_main():
             
             # Create an Adj List Graph
             case "1":
-                adj_list = ListDirectedWeightedGraph()
+                adj_list = ListDirectedWeightedGraph(observer=print)
                 print("\n⚠️ Make sure to add vertices through operation #1 before going for other operations.")
                 break
                       
             # Use example
             case "2":
-              adj_list = ListDirectedWeightedGraph()
+              adj_list = ListDirectedWeightedGraph(observer=print)
               # Directly populating the adj_list property of the object rather than using add_edge() in a bid to avoid the feedback print statements
               adj_list.adj_list = {0: [(0,10), (2,30), (3,19)], 1: [(0,17), (1,22), (2,37)], 2: [(1,672), (2,8), (3,45)], 3: []}
               print("\n👇🏻 Here's an example Adjacency List Graph:")
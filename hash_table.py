@@ -6,16 +6,17 @@ import utility
 # 🟥 =====> Hash Table applying the Separate Chaining (Open Hashing) collision resolution technique <=====
 
 # 🎯 The Chaining Hash Table class
-class ChainingHashTable:
-    def __init__(self, size):
+class ChainingHashTable(utility.Observable):
+    def __init__(self, size, observer=None):
         """
         Initialize the hash table with a given size.
         Each bucket is initialized as an empty list to handle collisions using chaining.
         """
+        self.observer = observer
         self.size = size
         self.table = [[] for _ in range(size)]
-        print(f"\n✅ Initialized hash table with {size} buckets.")
-        print("ℹ️ Since Chaining uses another data structure for collision resolution, the hash table remains dynamic, so you need not worry about storage space!\n")
+        self.notify(f"\n✅ Initialized hash table with {size} buckets.")
+        self.notify("ℹ️ Since Chaining uses another data structure for collision resolution, the hash table remains dynamic, so you need not worry about storage space!\n")
 
     def hash_function(self, key):
         """
@@ -28,16 +29,19 @@ class ChainingHashTable:
         """
         Insert a key-value pair into the hash table.
         If the key already exists, update its value.
+        Return the index of the bucket.
         """
         index = self.hash_function(key)
         # Check if the key already exists in the bucket
         for kv in self.table[index]:
             if kv[0] == key:
                 kv[1] = value
-                return f"\n✅ Insertion successful. Updated key ({key}) with value ({value}) at index {index}."
+                self.notify(f"\n✅ Insertion successful. Updated key ({key}) with value ({value}) at index {index}.")
+                return index
         # If the key does not exist, append the new key-value pair
         self.table[index].append([key, value])
-        return f"\n✅ Insertion successful. Inserted key ({key}) with value ({value}) at index {index}."
+        self.notify(f"\n✅ Insertion successful. Inserted key ({key}) with value ({value}) at index {index}.")
+        return index
 
     def lookup(self, key):
         """
@@ -49,15 +53,16 @@ class ChainingHashTable:
         for kv in self.table[index]:
             # If found ...
             if kv[0] == key:
-                return f"\n✅ Searching successful. Key ({key}) found at index {index} with value ({kv[1]})."
-                # return kv[1]
+                self.notify(f"\n✅ Searching successful. Key ({key}) found at index {index} with value ({kv[1]}).")
+                return kv[1]
         # If not found after looping through all the kvs ...
-        return f"\n❌ Searching successful. Key ({key}) not found."
-        # return None
+        self.notify(f"\n❌ Searching successful. Key ({key}) not found.")
+        return None
 
     def delete(self, key):
         """
         Delete a key-value pair from the hash table.
+        Return the value that was associated with the key.
         """
         index = self.hash_function(key)
         # Search for the key in the bucket
@@ -65,9 +70,10 @@ class ChainingHashTable:
             # If found ...
             if kv[0] == key:
                 del self.table[index][i]
-                return f"\n✅ Deletion successful. Deleted key ({key}) from index {index}."
+                self.notify(f"\n✅ Deletion successful. Deleted key ({key}) from index {index}.")
+                return kv[1]
         # If not found ...
-        return f"\n🚫 Deletion unsuccessful. Key ({key}) not found, nothing to delete."
+        self.fail(KeyError(key), f"\n🚫 Deletion unsuccessful. Key ({key}) not found, nothing to delete.")
 
     def display(self):
         """
@@ -96,7 +102,7 @@ def chaining_main():
                 while True:
                     size = utility.input_verify("int", "the total number of buckets you want; in other words, the size of the hash table")
                     if size is not None:
-                        chaining_ht = ChainingHashTable(size)
+                        chaining_ht = ChainingHashTable(size, observer=print)
                         chaining_ht.display()
                         break
                     else:
@@ -106,12 +112,14 @@ def chaining_main():
                       
             # Use example
             case "2":
+              # The example is filled in silently, the observer only gets attached afterwards
               chaining_ht = ChainingHashTable(5)
               # Directly populating the self.table property not possible here due to the built-in hash() function returning different values at different runs, causing the elements to go into different buckets & totally rendering hard-coded positioning useless!
               chaining_ht.insert("Messi", "10")
               chaining_ht.insert("Apple", 1976)
               chaining_ht.insert(2024, -273.15)
               chaining_ht.insert("UFO", "Roswell, NM")
+              chaining_ht.observer = print
               # Displaying the example hash table
               print("👇🏻 Here's an example Chaining Hash Table:")
               chaining_ht.display()
@@ -146,20 +154,17 @@ def chaining_main():
             case "1":
                 key = get_key()
                 value = get_value()
-                result = chaining_ht.insert(key, value)
-                print(result)
+                chaining_ht.insert(key, value)
             
             # Deletion
             case "2":
                 key = get_key(text="key that you want to delete")
-                result = chaining_ht.delete(key)
-                print(result)
+                chaining_ht.delete(key)
              
             # Searching
             case "3":
                 key = get_key(text="key that you want to  search for")
-                result = chaining_ht.lookup(key)
-                print(result)
+                chaining_ht.lookup(key)
             
             # Displaying
             case "4":
@@ -192,15 +197,16 @@ def chaining_main():
 # 🟥 =====> Hash Table applying the Linear Probing collision resolution technique from the Open Addressing (Close Hashing) category <=====
 
 # 🎯 The Linear Probing Hash Table class
-class LinearProbingHashTable:
-    def __init__(self, size):
+class LinearProbingHashTable(utility.Observable):
+    def __init__(self, size, observer=None):
         """
         Initialize the hash table with a given size.
         Each slot is initialized to None.
         """
+        self.observer = observer
         self.size = size
         self.table = [None] * size
-        print(f"\n✅ Initialized hash table with {size} slots.")
+        self.notify(f"\n✅ Initialized hash table with {size} slots.")
 
     def hash_function(self, key):
         """
@@ -209,63 +215,71 @@ class LinearProbingHashTable:
         """
         return hash(key) % self.size
 
-    def insert(self, key, value):
+    def probe(self, key):
         """
-        Insert a key-value pair into the hash table.
-        If the key already exists, update its value.
+        Find the slot holding the key, or else the first free slot of its cluster.
+        Return None if the key isn't there & the table is full.
         """
         index = self.hash_function(key)
         original_index = index
         while self.table[index] is not None:
             if self.table[index][0] == key:
-                self.table[index] = (key, value)
-                return f"\n✅ Insertion successful. Updated key ({key}) with value ({value}) at index {index}."
+                return index
             index = (index + 1) % self.size
             if index == original_index:
-                return "\n🚫 Insertion unsuccessful. Hash table is full; cannot insert new key."
+                return None
+        return index
+
+    def insert(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+        If the key already exists, update its value.
+        Return the index of the slot.
+        """
+        index = self.probe(key)
+        if index is None:
+            self.fail(OverflowError("Hash table is full"), "\n🚫 Insertion unsuccessful. Hash table is full; cannot insert new key.")
+            return None
+        updated = self.table[index] is not None
         self.table[index] = (key, value)
-        return f"\n✅ Insertion successful. Inserted key ({key}) with value ({value}) at index {index}."
+        if updated:
+            self.notify(f"\n✅ Insertion successful. Updated key ({key}) with value ({value}) at index {index}.")
+        else:
+            self.notify(f"\n✅ Insertion successful. Inserted key ({key}) with value ({value}) at index {index}.")
+        return index
 
     def lookup(self, key):
         """
         Look up the value associated with a given key.
         Return the value if found, otherwise return None.
         """
-        index = self.hash_function(key)
-        original_index = index
-        while self.table[index] is not None:
-            if self.table[index][0] == key:
-                return f"\n✅ Key ({key}) found at index {index} with value ({self.table[index][1]})."
-                # return self.table[index][1]
-            index = (index + 1) % self.size
-            if index == original_index:
-                break
-        return f"\n❌ Key ({key}) not found."
-        # return None
+        index = self.probe(key)
+        if index is not None and self.table[index] is not None:
+            self.notify(f"\n✅ Key ({key}) found at index {index} with value ({self.table[index][1]}).")
+            return self.table[index][1]
+        self.notify(f"\n❌ Key ({key}) not found.")
+        return None
 
     def delete(self, key):
         """
         Delete a key-value pair from the hash table.
+        Return the value that was associated with the key.
         """
-        index = self.hash_function(key)
-        original_index = index
-        while self.table[index] is not None:
-            if self.table[index][0] == key:
-                self.table[index] = None
-                print(f"\n✅ Deletion successful. Deleted key ({key}) from index {index}.")
-                # Rehash all elements in the same cluster
-                next_index = (index + 1) % self.size
-                while self.table[next_index] is not None:
-                    rehash_key, rehash_value = self.table[next_index]
-                    self.table[next_index] = None
-                    print("\n♻️ Rehashing...")
-                    self.insert(rehash_key, rehash_value)
-                    next_index = (next_index + 1) % self.size
-                return
-            index = (index + 1) % self.size
-            if index == original_index:
-                break
-        print(f"\n❌ Key ({key}) not found, nothing to delete.")
+        index = self.probe(key)
+        if index is not None and self.table[index] is not None:
+            value = self.table[index][1]
+            self.table[index] = None
+            self.notify(f"\n✅ Deletion successful. Deleted key ({key}) from index {index}.")
+            # Rehash all elements in the same cluster, placing them directly in their slots (rehashing isn't an insertion to report)
+            next_index = (index + 1) % self.size
+            while self.table[next_index] is not None:
+                rehash_key, rehash_value = self.table[next_index]
+                self.table[next_index] = None
+                self.notify("\n♻️ Rehashing...")
+                self.table[self.probe(rehash_key)] = (rehash_key, rehash_value)
+                next_index = (next_index + 1) % self.size
+            return value
+        self.fail(KeyError(key), f"\n❌ Key ({key}) not found, nothing to delete.")
 
     def display(self):
         """
@@ -294,7 +308,7 @@ def linear_probing_main():
                 while True:
                     size = utility.input_verify("int", "the total number of slots you want; in other words, the size of the hash table")
                     if size is not None:
-                        linear_probing_ht = LinearProbingHashTable(size)
+                        linear_probing_ht = LinearProbingHashTable(size, observer=print)
                         linear_probing_ht.display()
                         break
                     else:
@@ -304,11 +318,13 @@ def linear_probing_main():
                       
             # Use example
             case "2":
+              # The example is filled in silently, the observer only gets attached afterwards
               linear_probing_ht = LinearProbingHashTable(5)
               # Directly populating the self.table property not possible here due to the built-in hash() function returning different values at different runs, causing the elements to go into different buckets & totally rendering hard-coded positioning useless!
               linear_probing_ht.insert("Messi", "10")
               linear_probing_ht.insert("Apple", 1976)
               linear_probing_ht.insert(2024, -273.15)
+              linear_probing_ht.observer = print
               linear_probing_ht.display()
               break
                 
@@ -341,8 +357,7 @@ def linear_probing_main():
             case "1":
                 key = get_key()
                 value = get_value()
-                result = linear_probing_ht.insert(key, value)
-                print(result)
+                linear_probing_ht.insert(key, value)
             
             # Deletion
             case "2":
@@ -352,8 +367,7 @@ def linear_probing_main():
             # Searching
             case "3":
                 key = get_key(text="key that you want to  search for")
-                result = linear_probing_ht.lookup(key)
-                print(result)
+                linear_probing_ht.lookup(key)
             
             # Displaying
             case "4":
@@ -13,33 +13,37 @@ class Node:
 
 
 # 🎯 The Singly Linked List class
-class SinglyLinkedList:
-    def __init__(self):
+class SinglyLinkedList(utility.Observable):
+    def __init__(self, observer=None):
+        self.observer = observer
         self.head = None
 
     # 🖐🏻 Using fingers as nodes for visualizing the different scenarios & index handlings can help big time!
     
+    def report(self, message):
+        # Sends the outcome of an operation along with the resulting list to the observer; a silent list never traverses itself
+        if self.observer is not None:
+            self.notify(message + self._render())
+
+
     def insert_at_beginning(self, data):
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
-        print("\n✅ Insertion successful.", end="")
-        self.traverse()
+        self.report("\n✅ Insertion successful.")
 
 
     def insert_at_end(self, data):
         new_node = Node(data)
         if self.head is None:
             self.head = new_node
-            print("\n✅ Insertion successful.", end="")
-            self.traverse()
+            self.report("\n✅ Insertion successful.")
             return
         last = self.head
         while last.next:
             last = last.next
         last.next = new_node
-        print("\n✅ Insertion successful.", end="")
-        self.traverse()
+        self.report("\n✅ Insertion successful.")
 
 
     def insert_at_position(self, position, data):
@@ -53,89 +57,95 @@ class SinglyLinkedList:
         ## Adding to the next index not being a problem, catching a None if the index leaves at least two positions empty 
         for _ in range(position - 1):
             if current is None:
-                print("\n🚫 Position out of bounds. Insertion unsuccessful.")
+                self.fail(IndexError("Position out of bounds"), "\n🚫 Position out of bounds. Insertion unsuccessful.")
                 return
             current = current.next
         ## Catching a None if the index leaves only one position empty in between
         if current is None:
-                print("\n🚫 Position out of bounds. Insertion unsuccessful.")
+                self.fail(IndexError("Position out of bounds"), "\n🚫 Position out of bounds. Insertion unsuccessful.")
                 return
         new_node.next = current.next
         current.next = new_node
-        print("\n✅ Insertion successful.", end="")
-        self.traverse()
+        self.report("\n✅ Insertion successful.")
 
 
     def delete_from_beginning(self):
         if self.head is None:
-            print("\n🚫 List is empty.")
+            self.fail(IndexError("List is empty"), "\n🚫 List is empty.")
         # We may either return in the if block to exit the funcion or use else — more readable IMHO.
         else:
+            data = self.head.data
             self.head = self.head.next
-            print("\n✅ Deletion successful.", end="")
-            self.traverse()
+            self.report("\n✅ Deletion successful.")
+            return data
 
 
     def delete_from_end(self):
         # Empty list
         if self.head is None:
-            print("\n🚫 List is empty.")
+            self.fail(IndexError("List is empty"), "\n🚫 List is empty.")
             return
         # Just the head available
         if self.head.next is None:
+            data = self.head.data
             self.head = None
-            print("\n✅ Deletion successful.", end="")
-            self.traverse()
-            return
+            self.report("\n✅ Deletion successful.")
+            return data
         # Normal
         second_last = self.head
         while second_last.next.next:
             second_last = second_last.next
+        data = second_last.next.data
         second_last.next = None
-        print("\n✅ Deletion successful.", end="")
-        self.traverse()
+        self.report("\n✅ Deletion successful.")
+        return data
         
     
     def delete_from_position(self, position):
         # Empty list
         if self.head is None:
-            print("\n🚫 List is empty.")
+            self.fail(IndexError("List is empty"), "\n🚫 List is empty.")
             return
         # Just having the head
         if position == 0:
+            data = self.head.data
             self.head = self.head.next
-            print("\n✅ Deletion successful.", end="")
-            self.traverse()
-            return
+            self.report("\n✅ Deletion successful.")
+            return data
         # Normal
         current = self.head
         ## Catching a None if it's at least two positions away from the last item
         for _ in range(position - 1):
             if current.next is None:
-                print("\n🚫 Position out of bounds. Deletion unsuccessful.")
+                self.fail(IndexError("Position out of bounds"), "\n🚫 Position out of bounds. Deletion unsuccessful.")
                 return
             current = current.next
         ## Catching a None if it's only one position away from the last item (directly after the last)
         if current.next is None:
-            print("\n🚫 Position out of bounds. Deletion unsuccessful.")
+            self.fail(IndexError("Position out of bounds"), "\n🚫 Position out of bounds. Deletion unsuccessful.")
             return
+        data = current.next.data
         current.next = current.next.next
-        print("\n✅ Deletion successful.", end="")
-        self.traverse()
+        self.report("\n✅ Deletion successful.")
+        return data
 
 
     def traverse(self):
+        print(self._render())
+
+
+    def _render(self):
+        # The traversal as a string, so report can hand it to the observer instead of printing it
         current = self.head
         if current is None:
-            print("\n❌ List is empty.")
-            return
+            return "\n❌ List is empty."
         # The list for holding the elements to later print them with an arrow in between. Never Declare inside a loop since it'll be reset in every iteration, totally defying the purpose!
         # Since sep.join(list) method expects each list item to be a string, we typecast before appending. Using this method is preferred over a for loop since the loop would end up printing the arrow after the last item, too.
         sll_items = []
         while current:
             sll_items.append(str(current.data))
             current = current.next
-        print("\n👉", " => ".join(sll_items))
+        return "\n👉 " + " => ".join(sll_items)
 
 
     # Linear search, the only one suitable for linked lists
@@ -144,11 +154,11 @@ class SinglyLinkedList:
         position = 0
         while current:
             if current.data == target:
-                print(f"\n✅ Item found at position {position}.")
+                self.notify(f"\n✅ Item found at position {position}.")
                 return position
             current = current.next
             position += 1
-        print("\n❌ Item not found.")
+        self.notify("\n❌ Item not found.")
         return -1
 
 
@@ -156,7 +166,7 @@ class SinglyLinkedList:
 def sll_main():
     
     # Creating an SLL object to gain access to the methods of its related class
-    sll = SinglyLinkedList()
+    sll = SinglyLinkedList(observer=print)
     
     # 🟢 Operation selection loop
     while True:
@@ -297,34 +307,38 @@ class Node:
 
 
 # 🎯 The Doubly Linked List class
-class DoublyLinkedList:
-    def __init__(self):
+class DoublyLinkedList(utility.Observable):
+    def __init__(self, observer=None):
+        self.observer = observer
         self.head = None
 
 
+    def report(self, message):
+        # Sends the outcome of an operation along with the resulting list to the observer; a silent list never traverses itself
+        if self.observer is not None:
+            self.notify(message + self._render_forward())
+
+
     def insert_at_beginning(self, data):
         new_node = Node(data)
         new_node.next = self.head
         if self.head is not None:
             self.head.prev = new_node
         self.head = new_node
-        print("\n✅ Insertion successful.", end="")
-        self.traverse_forward()
+        self.report("\n✅ Insertion successful.")
 
     def insert_at_end(self, data):
         new_node = Node(data)
         if self.head is None:
             self.head = new_node
-            print("\n✅ Insertion successful.", end="")
-            self.traverse_forward()
+            self.report("\n✅ Insertion successful.")
             return
         last = self.head
         while last.next:
             last = last.next
         last.next = new_node
         new_node.prev = last
-        print("\n✅ Insertion successful.", end="")
-        self.traverse_forward()
+        self.report("\n✅ Insertion successful.")
 
     def insert_at_position(self, position, data):
         if position == 0:
@@ -335,7 +349,7 @@ class DoublyLinkedList:
         # Catching all None cases except the one right after the final item
         for _ in range(position):
             if current is None:
-                print("\n🚫 Position out of bounds. Insertion unsuccessful.")
+                self.fail(IndexError("Position out of bounds"), "\n🚫 Position out of bounds. Insertion unsuccessful.")
                 return
             current = current.next
         # Catching the None right after the final item & passing control to insert_at_end()
@@ -346,46 +360,46 @@ class DoublyLinkedList:
         new_node.next = current
         current.prev.next = new_node
         current.prev = new_node
-        print("\n✅ Insertion successful.", end="")
-        self.traverse_forward()
+        self.report("\n✅ Insertion successful.")
 
 
     def delete_from_beginning(self):
         if self.head is None:
-            print("\n🚫 List is empty.")
+            self.fail(IndexError("List is empty"), "\n🚫 List is empty.")
             return
+        data = self.head.data
         self.head = self.head.next
         if self.head is not None:
             self.head.prev = None
-        print("\n✅ Deletion successful.", end="")
-        self.traverse_forward()
+        self.report("\n✅ Deletion successful.")
+        return data
 
     def delete_from_end(self):
         if self.head is None:
-            print("\n🚫 List is empty.")
+            self.fail(IndexError("List is empty"), "\n🚫 List is empty.")
             return
         if self.head.next is None:
+            data = self.head.data
             self.head = None
-            print("\n✅ Deletion successful.", end="")
-            self.traverse_forward()
-            return
+            self.report("\n✅ Deletion successful.")
+            return data
         last = self.head
         while last.next:
             last = last.next
         last.prev.next = None
-        print("\n✅ Deletion successful.", end="")
-        self.traverse_forward()
+        self.report("\n✅ Deletion successful.")
+        return last.data
         
 
     def delete_from_position(self, position):
         if self.head is None:
-            print("\n🚫 List is empty.")
+            self.fail(IndexError("List is empty"), "\n🚫 List is empty.")
             return
         current = self.head
         for _ in range(position):
             current = current.next
             if current is None:
-                print("\n🚫 Position out of bounds. Deletion unsuccessful.")
+                self.fail(IndexError("Position out of bounds"), "\n🚫 Position out of bounds. Deletion unsuccessful.")
                 return
         if current.next:
             current.next.prev = current.prev
@@ -393,20 +407,24 @@ class DoublyLinkedList:
             current.prev.next = current.next
         else:
             self.head = current.next
-        print("\n✅ Deletion successful.", end="")
-        self.traverse_forward()
+        self.report("\n✅ Deletion successful.")
+        return current.data
 
 
     def traverse_forward(self):
+        print(self._render_forward())
+
+    def _render_forward(self):
+        # The forward traversal as a string, so report can hand it to the observer instead of printing it
         current = self.head
         if current is None:
-            print("\n👉 List is empty.")
+            return "\n👉 List is empty."
         else: # if-else
             dll_items = []
             while current:
                 dll_items.append(str(current.data))
                 current = current.next
-            print("\n👉", " <=> ".join(dll_items))
+            return "\n👉 " + " <=> ".join(dll_items)
 
     def traverse_backward(self):
         current = self.head
@@ -428,11 +446,11 @@ class DoublyLinkedList:
         position = 0
         while current:
             if current.data == target:
-                print(f"\n✅ Item found at position {position}.")
+                self.notify(f"\n✅ Item found at position {position}.")
                 return position
             current = current.next
             position += 1
-        print("\n❌ Item not found.")
+        self.notify("\n❌ Item not found.")
         return -1
 
 
@@ -440,7 +458,7 @@ class DoublyLinkedList:
 def dll_main():
     
     # Creating a DLL object to gain access to the methods of its related class
-    dll = DoublyLinkedList()
+    dll = DoublyLinkedList(observer=print)
     
     # 🟢 Operation selection loop
     while True:
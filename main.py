@@ -1,7 +1,7 @@
 import utility
 import my_array
 import stack
-import queue
+import my_queue
 import linked_list
 import tree
 import graph
@@ -48,7 +48,7 @@ def main():
                         
                         # Queue
                         case "3":
-                            queue.queue_main()
+                            my_queue.queue_main()
                             break
                         
                         # Linked List
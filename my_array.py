@@ -1,19 +1,242 @@
 # Array Implementation (static, fixed-type)
 # Module is named my_array to avoid conflict with Python's built-in array module.
 
+import array as py_array
+import bisect
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import mmap
+import operator
+import os
+import random
+import tempfile
+from multiprocessing import shared_memory
+
 import utility
 
+# NumPy is optional; without it the numpy storage engine is simply unavailable
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# NumPy dtypes of the numpy storage engine, & the dtype kinds each data type accepts in a batch (bool counting as int, like in Python)
+DTYPES = {int: "int64", float: "float64"}
+DTYPE_KINDS = {int: "biu", float: "f"}
+
+# Runs up to this length are left to insertion sort by the hybrid sorts
+SMALL_RUN = 16
+
+# Counting sort hands over to radix sort once its count table would have more slots than this many per element
+COUNTING_RANGE_FACTOR = 4
+
+
+# 🎯 The SortTracer class
+class SortTracer:
+    def __init__(self, callback=None, kinds=None, sample=1, max_events=None, capacity=1024):
+        """
+        Initializes a tracer for the Array sorting algorithms
+        Events are compare, swap & shift (with the two indices involved) & step (the end of a pass). Only the given kinds (all by default) are traced; of those, every sample-th event is kept in a ring buffer of the given capacity & passed to callback(kind, array, i, j), until max_events have been kept.
+        """
+        self.callback = callback
+        self.kinds = kinds
+        self.sample = sample
+        self.max_events = max_events
+        self.events = collections.deque(maxlen=capacity)
+        self.counts = collections.Counter()  # Every traced event by kind, sampled or not
+        self.seen = 0
+        self.kept = 0
+
+    def record(self, kind, array, i=None, j=None):
+        """
+        Records an event of a sorting algorithm
+        """
+        if self.kinds is not None and kind not in self.kinds:
+            return
+        self.counts[kind] += 1
+        self.seen += 1
+        if self.seen % self.sample or (self.max_events is not None and self.kept >= self.max_events):
+            return
+        self.kept += 1
+        self.events.append((kind, i, j))
+        if self.callback is not None:
+            self.callback(kind, array, i, j)
+
+    def reset(self):
+        """
+        Forgets all the recorded events
+        """
+        self.events.clear()
+        self.counts.clear()
+        self.seen = 0
+        self.kept = 0
+
+
+# 🎯 The range query structures behind Array.range_sum, range_min & range_max (all ranges are half-open: l..r-1)
+class FenwickTree:
+    def __init__(self, values):
+        """
+        Builds a Fenwick (binary indexed) tree of prefix sums over the values in O(n)
+        """
+        self.n = len(values)
+        self.tree = [0] + list(values)
+        for i in range(1, self.n + 1):
+            parent = i + (i & -i)
+            if parent <= self.n:
+                self.tree[parent] += self.tree[i]
+
+    def add(self, index, delta):
+        """
+        Adds delta to the value at index, in O(log n)
+        """
+        i = index + 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, count):
+        """
+        Returns the sum of the first count values, in O(log n)
+        """
+        total = 0
+        while count > 0:
+            total += self.tree[count]
+            count -= count & -count
+        return total
+
+    def range_sum(self, l, r):
+        return self.prefix_sum(r) - self.prefix_sum(l)
+
+
+class SparseTable:
+    def __init__(self, values, func):
+        """
+        Builds a sparse table answering func (min or max) over any range in O(1), in O(n log n)
+        Row k holds func over every window of 2**k values.
+        """
+        self.func = func
+        self.rows = [list(values)]
+        width = 1
+        while 2 * width <= len(values):
+            previous = self.rows[-1]
+            # Every window of 2 * width values is made of two adjacent windows of width values
+            self.rows.append(list(map(func, previous, previous[width:])))
+            width *= 2
+
+    def query(self, l, r):
+        # Two windows of the largest power of two fitting in the range cover it; overlapping doesn't matter for min & max
+        k = (r - l).bit_length() - 1
+        row = self.rows[k]
+        return self.func(row[l], row[r - (1 << k)])
+
+
+class SegmentTree:
+    def __init__(self, values, func):
+        """
+        Builds an iterative segment tree answering func (min or max) over any range in O(log n), in O(n)
+        The leaves sit at tree[n..2n-1] & every inner node i holds func of its children 2i & 2i+1.
+        """
+        self.func = func
+        self.n = len(values)
+        self.tree = [None] * self.n + list(values)
+        for i in range(self.n - 1, 0, -1):
+            self.tree[i] = func(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def update(self, index, value):
+        """
+        Sets the value at index & fixes its ancestors, in O(log n)
+        """
+        i = index + self.n
+        self.tree[i] = value
+        while i > 1:
+            i //= 2
+            self.tree[i] = self.func(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def query(self, l, r):
+        # Climbing from both ends of the range, taking in the nodes that stick out of it on the way
+        func = self.func
+        result = None
+        l += self.n
+        r += self.n
+        while l < r:
+            if l & 1:
+                result = self.tree[l] if result is None else func(result, self.tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                result = self.tree[r] if result is None else func(result, self.tree[r])
+            l //= 2
+            r //= 2
+        return result
+
+
+# Tracer callback of the interactive menu, showing the array after every sorting step
+def print_step(kind, array, i, j):
+    print("🔹", array.tolist())
+
+
+# Worker of Array.parallel_sort, sorting one chunk of the shared buffer in place
+def sort_shared_chunk(name, typecode, low, high, descending):
+    shared = shared_memory.SharedMemory(name=name)
+    view = shared.buf.cast(typecode)
+    chunk = view[low:high]
+    chunk[:] = py_array.array(typecode, sorted(chunk, reverse=descending))
+    # The views have to let go of the buffer before it can be closed
+    chunk.release()
+    view.release()
+    shared.close()
+
 
 # 🎯 The Array class
-class Array:
-    def __init__(self, size, data_type, default_value=None):
+class Array(utility.Observable):
+    def __init__(self, size, data_type, default_value=None, storage="list", observer=None, tracer=None):
         """
         Initializes an array with a size, data type & default value
+        storage="compact" keeps int/float elements unboxed in a stdlib array (8 bytes each) instead of a list of Python objects
+        storage="numpy" keeps them in a NumPy ndarray instead, so sort, the searches, bulk writes & the aggregates run as vectorized kernels
         """
+        self.observer = observer
+        self.tracer = tracer
         self.size = size
         self.data_type = data_type
         self.default_value = default_value
-        self.array = [default_value] * size if default_value is None or isinstance(default_value, data_type) else [data_type()] * size
+        self.storage = storage
+        
+        if storage == "list":
+            self.typecode = None
+            self.array = [default_value] * size if default_value is None or isinstance(default_value, data_type) else [data_type()] * size
+        elif storage == "compact":
+            if data_type not in utility.TYPECODES:
+                raise TypeError(f"Compact storage only supports int & float arrays, not {data_type.__name__}.")
+            self.typecode = utility.TYPECODES[data_type]
+            # A typed buffer can't hold None, so empty slots fall back to the zero value of the type
+            if not isinstance(default_value, data_type):
+                self.default_value = data_type()
+            self.array = py_array.array(self.typecode, [self.default_value]) * size
+        elif storage == "numpy":
+            if numpy is None:
+                raise ImportError("NumPy storage needs NumPy to be installed.")
+            if data_type not in DTYPES:
+                raise TypeError(f"NumPy storage only supports int & float arrays, not {data_type.__name__}.")
+            self.typecode = utility.TYPECODES[data_type]
+            if not isinstance(default_value, data_type):
+                self.default_value = data_type()
+            self.array = numpy.full(size, self.default_value, dtype=DTYPES[data_type])
+        else:
+            raise ValueError(f"Unknown storage: {storage}. Use either list, compact or numpy.")
+        
+        # The sorted index behind binary_search: the values in ascending order & their positions in the array (ties ordered by position). Built on demand, kept up to date by insert/remove & dropped by the sorts.
+        self._sorted_values = None
+        self._sorted_positions = None
+        
+        # The range indexes behind range_sum, range_min & range_max, also built on demand & kept up to date by insert/remove
+        ## range_mode picks the structure answering range_min/range_max: "dynamic" segment trees (O(log n) queries, O(log n) updates) or "static" sparse tables (O(1) queries, rebuilt after a write)
+        self.range_mode = "dynamic"
+        self._fenwick = None
+        self._range_tables = {}
 
 
     def insert(self, index, value):
@@ -21,12 +244,24 @@ class Array:
         Inserts an element into a specific index of the array
         """
         if not isinstance(value, self.data_type):
-            print(f"\n🚫 TypeError(Array can only contain elements of type {self.data_type.__name__}; item not inserted.)")
+            self.fail(TypeError(f"Array can only contain elements of type {self.data_type.__name__}"),
+                      f"\n🚫 TypeError(Array can only contain elements of type {self.data_type.__name__}; item not inserted.)")
         else:
             if 0 <= index < self.size:
+                try:
+                    # Checked against the typecode up front, since a mapped array's memoryview rejects the value with a ValueError instead
+                    if self.typecode is not None:
+                        py_array.array(self.typecode, [value])
+                except OverflowError as error:
+                    # Compact int arrays hold 64-bit signed integers only
+                    self.fail(error, "\n🚫 OverflowError(Value too large for a compact int array; item not inserted.)")
+                    return
+                # A Python scalar, so the index updates don't turn into (wrapping) NumPy arithmetic
+                old = self.array[index].item() if self.storage == "numpy" else self.array[index]
                 self.array[index] = value
+                self._reindex(index, old, value)
             else:
-                print("\n🚫 IndexError(Array index out of bounds; item not inserted.)")
+                self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds; item not inserted.)")
 
 
     def remove(self, index):
@@ -34,9 +269,11 @@ class Array:
         Removes an element from a specific index of the array
         """
         if 0 <= index < self.size:
+            old = self.array[index].item() if self.storage == "numpy" else self.array[index]
             self.array[index] = self.default_value
+            self._reindex(index, old, self.default_value)
         else:
-            print("\n🚫 IndexError(Array index out of bounds. Deletion unsuccessful.)")
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds. Deletion unsuccessful.)")
     
             
     def get(self, index):
@@ -44,37 +281,270 @@ class Array:
         Returns an element from a specific index of the array
         """
         if 0 <= index < self.size:
-            print(f"\n👉 {self.array[index]}")
+            value = self.array[index].item() if self.storage == "numpy" else self.array[index]
+            self.notify(f"\n👉 {value}")
+            return value
         else:
-            print("\n🚫 IndexError(Array index out of bounds.)")
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds.)")
 
 
     def display(self):
         """
         Displays the entire array
         """
-        print(f"\n👉 {self.array}")
+        print(f"\n👉 {self.tolist()}")
         
         # for i in range(self.size):
             # print(f"Index {i}: {self.array[i]}")
     
     
+    def tolist(self):
+        """
+        Returns the elements of the array as a Python list, whatever the storage
+        """
+        return list(self.array) if self.typecode is None else self.array.tolist()
+    
+    
+    def _pack(self, values):
+        """
+        Converts a sequence of values to the storage type of the array, ready for slice assignment
+        """
+        if self.storage == "numpy":
+            return numpy.array(values, dtype=DTYPES[self.data_type])
+        if self.typecode is None:
+            # A list storage holds Python objects, not NumPy scalars
+            return values.tolist() if numpy is not None and isinstance(values, numpy.ndarray) else values
+        return py_array.array(self.typecode, values)
+    
+    
+    def _invalidate(self):
+        """
+        Drops the sorted & range indexes after the elements were moved around
+        """
+        self._sorted_values = None
+        self._sorted_positions = None
+        self._fenwick = None
+        self._range_tables = {}
+    
+    
+    def _reindex(self, index, old, new):
+        """
+        Updates the sorted & range indexes after a single write: O(log n) for the sorted index (plus a memmove), the Fenwick tree & the segment trees
+        """
+        if old == new:
+            return
+        try:
+            if self._fenwick is not None:
+                self._fenwick.add(index, new - old)
+            for key, table in list(self._range_tables.items()):
+                if isinstance(table, SegmentTree):
+                    table.update(index, new)
+                else:
+                    del self._range_tables[key]  # A sparse table is static, it gets rebuilt by the next query
+        except TypeError:
+            # Same as below, for an element that can't be added or compared (e.g. the None default of an int list array)
+            self._fenwick = None
+            self._range_tables = {}
+        
+        values, positions = self._sorted_values, self._sorted_positions
+        if values is None:
+            return
+        if self.storage == "numpy":
+            # ndarrays can't grow or shrink in place; rebuilding the index is a vectorized O(n log n) anyway
+            self._sorted_values = self._sorted_positions = None
+            return
+        try:
+            # Entries with equal values are ordered by position, so the exact entry is found by bisecting the positions within the run of equal values
+            low = bisect.bisect_left(values, old)
+            at = bisect.bisect_left(positions, index, low, bisect.bisect_right(values, old, low))
+            del values[at]
+            del positions[at]
+            low = bisect.bisect_left(values, new)
+            at = bisect.bisect_left(positions, index, low, bisect.bisect_right(values, new, low))
+            values.insert(at, new)
+            positions.insert(at, index)
+        except TypeError:
+            # An element that can't be ordered (e.g. the None default of a str array) makes the index unusable until rebuilt
+            self._sorted_values = self._sorted_positions = None
+    
+    
+    # Bulk loading
+    @classmethod
+    def from_iterable(cls, values, data_type, default_value=None, storage="list", observer=None, tracer=None):
+        """
+        Creates an array holding the given values, sized to fit them
+        The values are type-checked as one batch rather than one insert at a time.
+        """
+        array = cls(0, data_type, default_value, storage, observer, tracer)
+        array.array = array._check_batch(values)
+        array.size = len(array.array)
+        return array
+    
+    
+    @classmethod
+    def from_buffer(cls, buffer, data_type, storage="compact", observer=None, tracer=None):
+        """
+        Creates an int/float array from a bytes-like object holding the values in machine format (8 bytes each)
+        """
+        if data_type not in utility.TYPECODES:
+            raise TypeError(f"Only int & float arrays can be loaded from a buffer, not {data_type.__name__}.")
+        values = py_array.array(utility.TYPECODES[data_type])
+        values.frombytes(buffer)
+        return cls._wrap(values, data_type, storage, observer, tracer)
+    
+    
+    @classmethod
+    def from_file(cls, path, data_type, storage="compact", observer=None, tracer=None):
+        """
+        Creates an int/float array from a binary file written by tofile
+        """
+        if data_type not in utility.TYPECODES:
+            raise TypeError(f"Only int & float arrays can be loaded from a file, not {data_type.__name__}.")
+        values = py_array.array(utility.TYPECODES[data_type])
+        with open(path, "rb") as file:
+            # Reading straight into the typed buffer, without an intermediate bytes copy
+            values.fromfile(file, os.fstat(file.fileno()).st_size // values.itemsize)
+        return cls._wrap(values, data_type, storage, observer, tracer)
+    
+    
+    @classmethod
+    def _wrap(cls, values, data_type, storage, observer, tracer):
+        """
+        Creates an array around a stdlib array of already validated values
+        """
+        array = cls(0, data_type, storage=storage, observer=observer, tracer=tracer)
+        array.array = values.tolist() if array.typecode is None else values if array.storage == "compact" else array._pack(values)
+        array.size = len(values)
+        return array
+    
+    
+    def tofile(self, path):
+        """
+        Writes the elements of an int/float array to a binary file (8 bytes each, machine format)
+        """
+        if self.data_type not in utility.TYPECODES:
+            raise TypeError(f"Only int & float arrays can be written to a file, not {self.data_type.__name__}.")
+        values = self.array if self.typecode is not None else py_array.array(utility.TYPECODES[self.data_type], self.array)
+        with open(path, "wb") as file:
+            file.write(values)
+    
+    
+    def extend_into(self, start, values):
+        """
+        Writes a batch of values into the array, starting from a specific index
+        """
+        batch = self._checked_batch(values)
+        if batch is None:
+            return
+        if not 0 <= start <= self.size - len(batch):
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds; items not inserted.)")
+            return
+        self.array[start:start + len(batch)] = batch
+        self._invalidate()
+    
+    
+    def _check_batch(self, values):
+        """
+        Type-checks a batch of values & converts it to the storage type of the array
+        Only the distinct types of the batch are checked, & the conversion to a compact array happens in C, so this takes a single pass over the values.
+        """
+        if isinstance(values, py_array.array) and values.typecode == self.typecode:
+            return self._pack(values)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            # An ndarray carries a single dtype, so there's nothing to check element by element
+            if self.data_type not in DTYPE_KINDS or values.dtype.kind not in DTYPE_KINDS[self.data_type]:
+                raise TypeError(f"Array can only contain elements of type {self.data_type.__name__}, got {values.dtype}")
+            return self._pack(values)
+        values = list(values)
+        wrong = [kind.__name__ for kind in set(map(type, values)) if not issubclass(kind, self.data_type)]
+        if wrong:
+            raise TypeError(f"Array can only contain elements of type {self.data_type.__name__}, got {', '.join(sorted(wrong))}")
+        # Compact int arrays hold 64-bit signed integers only, the conversion raises OverflowError otherwise
+        return self._pack(values)
+    
+    
+    def _checked_batch(self, values):
+        """
+        Returns the checked batch, or reports why it was rejected & returns None
+        """
+        try:
+            return self._check_batch(values)
+        except (TypeError, OverflowError) as error:
+            self.fail(error, f"\n🚫 {type(error).__name__}({error}; items not inserted.)")
+    
+    
+    # Indexing & slicing
+    def __len__(self):
+        return self.size
+    
+    
+    def __getitem__(self, key):
+        """
+        Returns an element, or a new array holding the elements of a slice
+        """
+        if isinstance(key, slice):
+            return self._like(self.array[key])
+        return self.array[key].item() if self.storage == "numpy" else self.array[key]
+    
+    
+    def _like(self, values):
+        """
+        Creates a new in-memory array of the same type & storage holding the given (already validated) values
+        """
+        array = Array(0, self.data_type, self.default_value, "list" if self.typecode is None else "numpy" if self.storage == "numpy" else "compact")
+        array.array = self._pack(values)
+        array.size = len(array.array)
+        return array
+    
+    
+    def __setitem__(self, key, value):
+        """
+        Sets an element, or the elements of a slice; the array can't grow or shrink, so a slice takes exactly as many values as it covers
+        """
+        if not isinstance(key, slice):
+            self.insert(key + self.size if key < 0 else key, value)
+            return
+        batch = self._checked_batch(value)
+        if batch is None:
+            return
+        length = len(range(*key.indices(self.size)))
+        if len(batch) != length:
+            self.fail(ValueError(f"attempt to assign {len(batch)} values to a slice of size {length}"),
+                      f"\n🚫 ValueError(The slice covers {length} items, but {len(batch)} were given; items not inserted.)")
+            return
+        self.array[key] = batch
+        self._invalidate()
+    
+    
     # Python built-in sorting
     def sort(self):
-        self.array = sorted(self.array)
-        # self.array.sort() also possible since self.array is a list, so we can use list methods with it; however, writing self.sort() ends up referring to the Array class object with no sort method, thereby resulting in an error!
+        if self.storage == "numpy":
+            self.array.sort()
+            self._invalidate()
+            return
+        self.array[:] = self._pack(sorted(self.array))
+        self._invalidate()
+        # Writing back through a slice keeps the storage (list or compact) intact; writing self.sort() ends up referring to the Array class object, not the list method!
+    
     
+    # 🪜 All the sorting algorithms below report compares, swaps, shifts & steps to self.tracer (a SortTracer) if one is attached. The tracer is looked up once per call & every hook sits behind an `is not None` check, so an untraced sort runs at algorithm speed.
     
     def bubble_sort(self, order):
         """
         Sorts the array using the Bubble Sort algorithm
         """
+        tracer = self.tracer
         n = len(self.array)
         for i in range(n):
             for j in range(0, n-i-1):
+                if tracer is not None:
+                    tracer.record("compare", self, j, j+1)
                 if (order == 'asc' and self.array[j] > self.array[j+1]) or (order == 'desc' and self.array[j] < self.array[j+1]):
                     self.array[j], self.array[j+1] = self.array[j+1], self.array[j]
-                    print("🔹", self.array)
+                    if tracer is not None:
+                        tracer.record("swap", self, j, j+1)
+                        tracer.record("step", self)
+        self._invalidate()
         return self.array # Not really needed here, all the sorting algorithms sort the array in place & calling the display is all we need to show the final, sorted array
     
     
@@ -82,6 +552,7 @@ class Array:
         """
         Sorts the array using the Selection Sort algorithm
         """
+        tracer = self.tracer
         # Get the length of the array
         n = len(self.array)
 
@@ -90,13 +561,18 @@ class Array:
             # Find the minimum element in remaining unsorted array
             min_max_index = i
             for j in range(i+1, n):
+                if tracer is not None:
+                    tracer.record("compare", self, min_max_index, j)
                 if (order == 'asc' and self.array[min_max_index] > self.array[j]) or \
                    (order == 'desc' and self.array[min_max_index] < self.array[j]):
                     min_max_index = j            
             # Swap the found minimum/maximum element with the first element
             self.array[i], self.array[min_max_index] = self.array[min_max_index], self.array[i]
-            print("🔹", self.array)
+            if tracer is not None:
+                tracer.record("swap", self, i, min_max_index)
+                tracer.record("step", self)
 
+        self._invalidate()
         return self.array
 
     
@@ -104,6 +580,7 @@ class Array:
         """
         Sorts the array using the Insertion Sort algorithm
         """
+        tracer = self.tracer
         # Traverse from 1 to len(self.array)
         for i in range(1, len(self.array)):
             key = self.array[i]
@@ -113,86 +590,117 @@ class Array:
             # of their current position
             while j >= 0 and ((order == 'asc' and key < self.array[j]) or (order == 'desc' and key > self.array[j])):
                 self.array[j+1] = self.array[j]
+                if tracer is not None:
+                    tracer.record("shift", self, j, j+1)
                 j -= 1
             self.array[j+1] = key
-            print("🔹", self.array)
+            if tracer is not None:
+                tracer.record("step", self)
+        self._invalidate()
         return self.array
 
 
     def quick_sort(self, order):
         """
-        Helper Method for Quick Sort
+        Sorts the array using the Quick Sort algorithm (iterative, median-of-three pivot & three-way partitioning)
         """
-        def partition(arr, low, high, order):
-            pivot = arr[high]
-            i = low - 1
-            for j in range(low, high):
-                if (order == 'asc' and arr[j] <= pivot) or (order == 'desc' and arr[j] >= pivot):
-                    i += 1
-                    arr[i], arr[j] = arr[j], arr[i]
-            arr[i + 1], arr[high] = arr[high], arr[i + 1]
-            print("🔹", self.array)
-            return i + 1
-
-        def quicksort_recursive(arr, low, high, order):
-            """
-            Sorts the array using the Quick Sort algorithm
-            """
-            if low < high:
-                pi = partition(arr, low, high, order)
-                quicksort_recursive(arr, low, pi - 1, order)
-                quicksort_recursive(arr, pi + 1, high, order)
-
-        quicksort_recursive(self.array, 0, len(self.array) - 1, order)
+        tracer = self.tracer
+        before = operator.lt if order == 'asc' else operator.gt
+        arr = self.array
+        
+        # An explicit stack of (low, high) sub-arrays replaces the recursion, so sorted or all-equal input can't hit the recursion limit
+        ranges = [(0, len(arr) - 1)]
+        while ranges:
+            low, high = ranges.pop()
+            if low >= high:
+                continue
+            lt, gt = self._partition(low, high, before)
+            if tracer is not None:
+                tracer.record("step", self)
+            
+            # The elements equal to the pivot are in place. Pushing the larger side first gets the smaller one handled next, which bounds the stack to O(log n).
+            if lt - low > high - gt:
+                ranges.append((low, lt - 1))
+                ranges.append((gt + 1, high))
+            else:
+                ranges.append((gt + 1, high))
+                ranges.append((low, lt - 1))
+        
+        self._invalidate()
         return self.array
         
     
+    def _partition(self, low, high, before):
+        """
+        Helper method partitioning self.array[low..high] three ways around a pivot & returning (lt, gt): arr[low..lt-1] comes before the pivot, arr[lt..gt] equals it & arr[gt+1..high] comes after it
+        """
+        tracer = self.tracer
+        arr = self.array
+        
+        # Median of three randomly picked elements as the pivot. Fixed positions (first, middle, last) aren't enough here: the three-way partition shuffles the upper part of sorted input into a pattern that keeps defeating them.
+        first, middle, last = arr[random.randint(low, high)], arr[random.randint(low, high)], arr[random.randint(low, high)]
+        if before(middle, first):
+            first, middle = middle, first
+        if before(last, middle):
+            middle = last if before(first, last) else first
+        pivot = middle
+        
+        # Dutch national flag partition, arr[lt..i-1] being the elements equal to the pivot seen so far
+        lt, i, gt = low, low, high
+        while i <= gt:
+            if tracer is not None:
+                tracer.record("compare", self, i)
+            if before(arr[i], pivot):
+                arr[lt], arr[i] = arr[i], arr[lt]
+                if tracer is not None:
+                    tracer.record("swap", self, lt, i)
+                lt += 1
+                i += 1
+            elif before(pivot, arr[i]):
+                arr[i], arr[gt] = arr[gt], arr[i]
+                if tracer is not None:
+                    tracer.record("swap", self, i, gt)
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt
+    
+    
     def heapify(self, n, i, order):
         """
         Helper method for Heap Sort
         """
-        # Initialize largest as root
-        largest_smallest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-
-        # See if left child of root exists and is greater than root
-        if order == 'asc' and left < n and self.array[i] < self.array[left]:
-            largest_smallest = left
-        elif order == 'desc' and left < n and self.array[i] > self.array[left]:
-            largest_smallest = left
-
-        # See if right child of root exists and is greater than root
-        if order == 'asc' and right < n and self.array[largest_smallest] < self.array[right]:
-            largest_smallest = right
-        elif order == 'desc' and right < n and self.array[largest_smallest] > self.array[right]:
-            largest_smallest = right
-
-        # Change root, if needed
-        if largest_smallest != i:
-            self.array[i], self.array[largest_smallest] = self.array[largest_smallest], self.array[i]  # swap
-            # Heapify the root
-            self.heapify(n, largest_smallest, order)
+        self._sift_down(0, i, n, operator.lt if order == 'asc' else operator.gt)
+        self._invalidate()
 
     def heap_sort(self, order):
         """
         Sorts the array using the Heap Sort algorithm
         """
-        n = len(self.array)
+        tracer = self.tracer
+        # Picking the comparison once for the whole sort: a max heap for asc & a min heap for desc
+        before = operator.lt if order == 'asc' else operator.gt
+        arr = self.array
+        n = len(arr)
 
         # Build a max/min heap
         for i in range(n // 2 - 1, -1, -1):
-            self.heapify(n, i, order)
-            print("🔹", self.array)
+            self._sift_down(0, i, n, before)
+            if tracer is not None:
+                tracer.record("step", self)
 
         # One by one extract elements
         for i in range(n-1, 0, -1):
-            self.array[i], self.array[0] = self.array[0], self.array[i]  # swap
-            print("🔹", self.array)
+            arr[i], arr[0] = arr[0], arr[i]  # swap
+            if tracer is not None:
+                tracer.record("swap", self, 0, i)
+                tracer.record("step", self)
             
-            self.heapify(i, 0, order)
-            print("🔹", self.array)
+            self._sift_down(0, 0, i, before)
+            if tracer is not None:
+                tracer.record("step", self)
 
+        self._invalidate()
         return self.array
     
     
@@ -200,6 +708,7 @@ class Array:
         """
         Sorts the array using the Shell Sort algorithm
         """
+        tracer = self.tracer
         n = len(self.array)
         gap = n // 2
 
@@ -215,16 +724,253 @@ class Array:
                 j = i
                 while j >= gap and ((order == 'asc' and self.array[j - gap] > temp) or (order == 'desc' and self.array[j - gap] < temp)):
                     self.array[j] = self.array[j - gap]
+                    if tracer is not None:
+                        tracer.record("shift", self, j - gap, j)
                     j -= gap
 
                 # Put temp (the original self.array[i]) in its correct location
                 self.array[j] = temp
-            print("🔹", self.array)
+            if tracer is not None:
+                tracer.record("step", self)
             gap //= 2
             
+        self._invalidate()
         return self.array
  
                
+    def merge_sort(self, order):
+        """
+        Sorts the array using the bottom-up (iterative & stable) Merge Sort algorithm
+        """
+        tracer = self.tracer
+        # Picking the comparison once: an element of the right run only goes first if it comes strictly before the left one, which keeps the sort stable
+        before = operator.lt if order == 'asc' else operator.gt
+        src = list(self.array)
+        dst = src[:]
+        n = len(src)
+        
+        # Merging runs of width 1, 2, 4, ... back & forth between the two buffers
+        width = 1
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+                i, j, k = low, mid, low
+                while i < mid and j < high:
+                    if before(src[j], src[i]):
+                        dst[k] = src[j]
+                        j += 1
+                    else:
+                        dst[k] = src[i]
+                        i += 1
+                    k += 1
+                # Copying whatever is left of either run
+                dst[k:k + mid - i] = src[i:mid]
+                k += mid - i
+                dst[k:k + high - j] = src[j:high]
+            src, dst = dst, src
+            width *= 2
+            if tracer is not None:
+                self.array[:] = self._pack(src)  # Only a traced sort pays for showing the intermediate passes
+                tracer.record("step", self)
+        
+        self.array[:] = self._pack(src)
+        self._invalidate()
+        return self.array
+    
+    
+    def intro_sort(self, order):
+        """
+        Sorts the array using Introsort: an iterative Quick Sort that falls back to Heap Sort on too deep partitions & leaves small runs to Insertion Sort
+        """
+        tracer = self.tracer
+        before = operator.lt if order == 'asc' else operator.gt
+        arr = self.array
+        n = len(arr)
+        
+        # An explicit stack of (low, high, depth budget) ranges instead of recursion
+        ranges = [(0, n - 1, 2 * n.bit_length())]
+        while ranges:
+            low, high, depth = ranges.pop()
+            if high - low < SMALL_RUN:
+                continue  # Finished by the final insertion sort pass
+            if depth == 0:
+                # Too many bad pivots in a row; Heap Sort keeps the worst case at O(n log n)
+                self._heap_sort_range(low, high, before)
+                continue
+            
+            # Median-of-three pivot, then a Hoare-style partition around it
+            mid = (low + high) // 2
+            if before(arr[mid], arr[low]):
+                arr[low], arr[mid] = arr[mid], arr[low]
+            if before(arr[high], arr[low]):
+                arr[low], arr[high] = arr[high], arr[low]
+            if before(arr[high], arr[mid]):
+                arr[mid], arr[high] = arr[high], arr[mid]
+            pivot = arr[mid]
+            i, j = low, high
+            while i <= j:
+                while before(arr[i], pivot):
+                    i += 1
+                while before(pivot, arr[j]):
+                    j -= 1
+                if i <= j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    if tracer is not None:
+                        tracer.record("swap", self, i, j)
+                    i += 1
+                    j -= 1
+            if tracer is not None:
+                tracer.record("step", self)
+            
+            # Pushing the larger part first, so the smaller one is handled next & the stack stays O(log n)
+            if j - low > high - i:
+                ranges.append((low, j, depth - 1))
+                ranges.append((i, high, depth - 1))
+            else:
+                ranges.append((i, high, depth - 1))
+                ranges.append((low, j, depth - 1))
+        
+        # Every element is now at most SMALL_RUN positions away from its place
+        self._insertion_sort_range(0, n - 1, before)
+        if tracer is not None:
+            tracer.record("step", self)
+        self._invalidate()
+        return self.array
+    
+    
+    def _insertion_sort_range(self, low, high, before):
+        """
+        Helper method sorting self.array[low..high] by Insertion Sort
+        """
+        arr = self.array
+        for i in range(low + 1, high + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= low and before(key, arr[j]):
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    
+    
+    def _sift_down(self, low, root, n, before):
+        """
+        Helper method restoring the heap property of the heap of n elements stored from self.array[low], iteratively
+        """
+        # Floyd's bottom-up variant: the displaced item almost always belongs near the bottom, so rather than comparing it on every level, walk the hole down to a leaf (one compare per level) & then sift the item back up (usually a step or two)
+        tracer = self.tracer
+        arr = self.array
+        item = arr[low + root]
+        start = root
+        child = 2 * root + 1
+        while child < n:
+            # Picking the child that comes last in the wanted order (the larger one for asc)
+            if child + 1 < n:
+                if tracer is not None:
+                    tracer.record("compare", self, low + child, low + child + 1)
+                if before(arr[low + child], arr[low + child + 1]):
+                    child += 1
+            arr[low + root] = arr[low + child]
+            if tracer is not None:
+                tracer.record("shift", self, low + child, low + root)
+            root = child
+            child = 2 * root + 1
+        
+        while root > start:
+            parent = (root - 1) // 2
+            if tracer is not None:
+                tracer.record("compare", self, low + parent, low + root)
+            if not before(arr[low + parent], item):
+                break
+            arr[low + root] = arr[low + parent]
+            if tracer is not None:
+                tracer.record("shift", self, low + parent, low + root)
+            root = parent
+        arr[low + root] = item
+    
+    
+    def _heap_sort_range(self, low, high, before):
+        """
+        Helper method sorting self.array[low..high] by Heap Sort
+        """
+        arr = self.array
+        n = high - low + 1
+        for root in range(n // 2 - 1, -1, -1):
+            self._sift_down(low, root, n, before)
+        for end in range(n - 1, 0, -1):
+            arr[low], arr[low + end] = arr[low + end], arr[low]
+            self._sift_down(low, 0, end, before)
+    
+    
+    def counting_sort(self, order):
+        """
+        Sorts an int array using the Counting Sort algorithm
+        A sparse range (e.g. two numbers far apart) would need a huge count table, so those arrays are sorted with radix_sort instead.
+        """
+        if self.data_type is not int:
+            self.fail(TypeError("Counting Sort only works on int arrays"), "\n🚫 TypeError(Counting Sort only works on int arrays.)")
+            return self.array
+        if len(self.array) < 2:
+            return self.array
+        
+        # Python ints, so the offsets can't wrap around the way int64 NumPy scalars do
+        elements = self.tolist()
+        low, high = min(elements), max(elements)
+        if high - low + 1 > max(COUNTING_RANGE_FACTOR * len(elements), 2**16):
+            return self.radix_sort(order)
+        counts = [0] * (high - low + 1)
+        for value in elements:
+            counts[value - low] += 1
+        
+        values = range(low, high + 1) if order == 'asc' else range(high, low - 1, -1)
+        result = []
+        for value in values:
+            count = counts[value - low]
+            if count:
+                result.extend([value] * count)
+        self.array[:] = self._pack(result)
+        if self.tracer is not None:
+            self.tracer.record("step", self)
+        self._invalidate()
+        return self.array
+    
+    
+    def radix_sort(self, order):
+        """
+        Sorts an int array using the LSD (Least Significant Digit) Radix Sort algorithm with base 256 digits
+        """
+        tracer = self.tracer
+        if self.data_type is not int:
+            self.fail(TypeError("Radix Sort only works on int arrays"), "\n🚫 TypeError(Radix Sort only works on int arrays.)")
+            return self.array
+        if len(self.array) < 2:
+            return self.array
+        
+        # Offsetting by the minimum makes every key non-negative, negative numbers included (as Python ints, so the offsets can't wrap around the way int64 NumPy scalars do)
+        values = self.tolist()
+        low = min(values)
+        span = max(values) - low
+        
+        # One stable bucket distribution per byte of the keys, least significant first
+        shift = 0
+        while span >> shift:
+            buckets = [[] for _ in range(256)]
+            for value in values:
+                buckets[((value - low) >> shift) & 255].append(value)
+            values = [value for bucket in buckets for value in bucket]
+            shift += 8
+            if tracer is not None:
+                self.array[:] = self._pack(values)
+                tracer.record("step", self)
+        
+        # Equal ints are indistinguishable, so reversing is as good as a stable descending sort
+        if order == 'desc':
+            values.reverse()
+        self.array[:] = self._pack(values)
+        self._invalidate()
+        return self.array
+    
+    
     def sort_intro(self):
         """
         UI helper method
@@ -242,41 +988,424 @@ class Array:
         self.display()
     
     
+    # Selection & partial sorting
+    def select(self, k, order='asc'):
+        """
+        Returns the element that would be at index k if the array were sorted, using the Introselect algorithm (expected O(n))
+        The array is rearranged on the way, like C++'s nth_element: the element ends up at index k, with no element after it in the order before it & none before it after it. k = len // 2 gives the median.
+        """
+        if not 0 <= k < len(self.array):
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds.)")
+            return None
+        self._select(k, operator.lt if order == 'asc' else operator.gt)
+        self._invalidate()
+        value = self.array[k].item() if self.storage == "numpy" else self.array[k]
+        self.notify(f"\n👉 Element #{k} in {order} order: {value}")
+        return value
+    
+    
+    def top_k(self, k, order='asc'):
+        """
+        Returns a new array holding the first k elements of the array in the given order (the k smallest for asc, the k largest for desc), in O(n log k)
+        The array itself is left untouched.
+        """
+        if k < 0:
+            self.fail(ValueError("k can't be negative"), "\n🚫 ValueError(k can't be negative.)")
+            return None
+        # heapq keeps a heap of the k best elements seen so far, which is what makes it O(n log k) rather than O(n log n)
+        best = heapq.nsmallest(k, self.array) if order == 'asc' else heapq.nlargest(k, self.array)
+        return self._like(best)
+    
+    
+    def partial_sort(self, k, order='asc'):
+        """
+        Puts the first k elements of the given order, sorted, at the start of the array, leaving the rest in no particular order, in O(n + k log k)
+        """
+        n = len(self.array)
+        if not 0 <= k <= n:
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds.)")
+            return self.array
+        before = operator.lt if order == 'asc' else operator.gt
+        # Selecting the element at k already gathers the first k elements in front of it, they just need sorting
+        if k < n:
+            self._select(k, before)
+        self.array[:k] = self._pack(sorted(self.array[:k], reverse=order != 'asc'))
+        if self.tracer is not None:
+            self.tracer.record("step", self)
+        self._invalidate()
+        return self.array
+    
+    
+    def _select(self, k, before):
+        """
+        Helper method moving the element of rank k to self.array[k] with the elements before it in front & those after it behind
+        """
+        tracer = self.tracer
+        low, high = 0, len(self.array) - 1
+        depth = 2 * len(self.array).bit_length()
+        
+        # Quickselect only keeps partitioning the side holding k, which is what makes it expected O(n)
+        while high - low >= SMALL_RUN:
+            if depth == 0:
+                # Too many bad pivots in a row; sorting what's left by Heap Sort bounds the worst case to O(n log n)
+                self._heap_sort_range(low, high, before)
+                return
+            depth -= 1
+            lt, gt = self._partition(low, high, before)
+            if tracer is not None:
+                tracer.record("step", self)
+            if k < lt:
+                high = lt - 1
+            elif k > gt:
+                low = gt + 1
+            else:
+                return  # k landed among the elements equal to the pivot
+        self._insertion_sort_range(low, high, before)
+    
+    
+    def external_sort(self, order, memory_budget=64 * 2**20, temp_dir=None):
+        """
+        Sorts an int/float array that may not fit in memory (typically a MappedArray) using an External Merge Sort
+        The array is cut into runs of memory_budget bytes, each sorted in memory & written to a temporary file in temp_dir, then the runs are k-way merged with a heap straight back into the array.
+        """
+        if self.data_type not in utility.TYPECODES:
+            self.fail(TypeError("External Sort only works on int & float arrays"), "\n🚫 TypeError(External Sort only works on int & float arrays.)")
+            return self.array
+        typecode = utility.TYPECODES[self.data_type]
+        itemsize = py_array.array(typecode).itemsize
+        n = len(self.array)
+        run_length = max(1, memory_budget // itemsize)
+        descending = order != 'asc'
+        
+        # A single run is just an in-memory sort
+        if n <= run_length:
+            self.array[:] = self._pack(sorted(self.array, reverse=descending))
+            self._invalidate()
+            return self.array
+        
+        with tempfile.TemporaryDirectory(prefix="pydsa-sort-", dir=temp_dir) as directory:
+            # 1️⃣ Writing the sorted runs
+            paths = []
+            for start in range(0, n, run_length):
+                run = py_array.array(typecode, sorted(self.array[start:start + run_length], reverse=descending))
+                paths.append(os.path.join(directory, f"run{len(paths)}.bin"))
+                with open(paths[-1], "wb") as file:
+                    file.write(run)
+                del run
+            
+            # 2️⃣ Merging the runs, the budget being shared by one read buffer per run plus the write buffer
+            block = max(1, run_length // (len(paths) + 1))
+            files = [open(path, "rb") for path in paths]
+            try:
+                merged = heapq.merge(*(self._read_blocks(file, typecode, block) for file in files), reverse=descending)
+                position = 0
+                while True:
+                    values = py_array.array(typecode, itertools.islice(merged, block))
+                    if not values:
+                        break
+                    self.array[position:position + len(values)] = self._pack(values)
+                    position += len(values)
+            finally:
+                for file in files:
+                    file.close()
+        
+        self._invalidate()
+        return self.array
+    
+    
+    def parallel_sort(self, order, workers=None):
+        """
+        Sorts an int/float array on several processes (all the cores by default)
+        The elements are copied once into a shared memory buffer, each worker sorts its own chunk of it in place (nothing gets pickled but the chunk bounds), then the sorted chunks are merged.
+        """
+        if self.data_type not in utility.TYPECODES:
+            self.fail(TypeError("Parallel Sort only works on int & float arrays"), "\n🚫 TypeError(Parallel Sort only works on int & float arrays.)")
+            return self.array
+        typecode = utility.TYPECODES[self.data_type]
+        workers = workers or os.cpu_count() or 1
+        n = len(self.array)
+        descending = order != 'asc'
+        
+        # Starting processes isn't worth it for a single worker or a small array
+        if workers == 1 or n < workers * 2**12:
+            self.array[:] = self._pack(sorted(self.array, reverse=descending))
+            self._invalidate()
+            return self.array
+        
+        values = self.array if self.typecode is not None else py_array.array(typecode, self.array)
+        # Viewing the elements as raw bytes first, as the format of an ndarray's buffer (e.g. "l") may not match the typecode
+        shared = shared_memory.SharedMemory(create=True, size=n * py_array.array(typecode).itemsize)
+        view = shared.buf.cast(typecode)
+        try:
+            view[:] = memoryview(values).cast("B").cast(typecode)
+            bounds = [n * worker // workers for worker in range(workers + 1)]
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = [executor.submit(sort_shared_chunk, shared.name, typecode, low, high, descending)
+                          for low, high in zip(bounds, bounds[1:])]
+                for chunk in chunks:
+                    chunk.result()
+            # Timsort spots the sorted chunks as runs & merges them in C, which beats a Python heap merge by far
+            self.array[:] = self._pack(sorted(view, reverse=descending))
+        finally:
+            view.release()
+            shared.close()
+            shared.unlink()
+        
+        self._invalidate()
+        return self.array
+    
+    
+    @staticmethod
+    def _read_blocks(file, typecode, block):
+        """
+        Yields the values of a run file, reading block values at a time
+        """
+        while True:
+            values = py_array.array(typecode)
+            values.frombytes(file.read(block * values.itemsize))
+            if not values:
+                return
+            yield from values
+    
+    
     def linear_search(self, target):
         """
         Searches the array using the Linear Search algorithm
         """
+        if self.storage == "numpy":
+            # One vectorized comparison over the whole array, then the first hit
+            hits = numpy.flatnonzero(self.array == target)
+            if len(hits):
+                index = int(hits[0])
+                self.notify(f"\n✅ Element found at index: {index}.")
+                return index
+            self.notify("\n❌ Element not found.")
+            return -1
         for index, value in enumerate(self.array):
             if value == target:
-                print(f"\n✅ Element found at index: {index}.")
+                self.notify(f"\n✅ Element found at index: {index}.")
                 return index
-        print("\n❌ Element not found.")
+        self.notify("\n❌ Element not found.")
         return -1
     
     
+    def _sorted_index(self):
+        """
+        Returns the sorted index (values, positions) of the array, building it first if needed
+        """
+        if self._sorted_values is None and self.storage == "numpy":
+            self._sorted_positions = numpy.argsort(self.array, kind="stable")
+            self._sorted_values = self.array[self._sorted_positions]
+        elif self._sorted_values is None:
+            # Sorting the positions by value (stable, so equal values keep their positions in order) rather than sorting a copy of the values, so the original index of every value is kept
+            positions = sorted(range(len(self.array)), key=self.array.__getitem__)
+            self._sorted_values = self._pack([self.array[position] for position in positions])
+            self._sorted_positions = py_array.array("q", positions)
+        return self._sorted_values, self._sorted_positions
+    
+    
     def binary_search(self, target):
         """
         Searches the array using the Binary Search algorithm
+        Works on a sorted index of the array that is built by the first search & kept up to date by insert/remove, so repeated searches take O(log n). Returns the index of the first occurrence of the target or -1.
         """
-        index_mapping = {value: index for index, value in enumerate(self.array)}
-        # Create a copy of the original array to sort
-        sorted_array = self.array[:]
-        # Sort the copy using Python's built-in sort method
-        sorted_array.sort()
-
-        left, right = 0, len(sorted_array) - 1
-        while left <= right:
-            mid = (left + right) // 2
-            if sorted_array[mid] == target:
-                # Use the index mapping to find the original index
-                original_index = index_mapping[sorted_array[mid]]
-                print(f"\n✅ Element found at index: {original_index}.")
-                return  # Exit after printing the result
-            elif sorted_array[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
-        print("\n❌ Element not found.")
+        values, positions = self._sorted_index()
+        # bisect_left (or searchsorted, its vectorized NumPy counterpart) halves the search interval until it lands on the leftmost element not less than the target
+        found = int(values.searchsorted(target)) if self.storage == "numpy" else bisect.bisect_left(values, target)
+        if found < len(values) and values[found] == target:
+            original_index = int(positions[found])
+            self.notify(f"\n✅ Element found at index: {original_index}.")
+            return original_index
+        self.notify("\n❌ Element not found.")
+        return -1
+    
+    
+    def search_many(self, targets, strategy=None):
+        """
+        Looks up a batch of targets at once & returns an int Array holding the index of the first occurrence of each target (or -1)
+        The strategy is one of "hash", "merge" or "bisect"; by default it's picked from the batch & array sizes. NumPy arrays also have "searchsorted", a vectorized bisect that they always use by default.
+        """
+        targets = list(targets)
+        m, n = len(targets), len(self.array)
+        if strategy is None and self.storage == "numpy":
+            strategy = "searchsorted"
+        elif strategy is None:
+            # With the sorted index already built, up to about n/4 targets are cheapest as binary searches
+            # Past that (or without the index, which costs O(n log n) to build) a hash index over the array pays for its O(n) pass
+            # The merge join is the fallback for elements that can be ordered but not hashed
+            strategy = "bisect" if self._sorted_values is not None and m * 4 < n else "hash"
+        
+        match strategy:
+            case "hash":
+                try:
+                    # Walking the array backwards so the first occurrence of every value is the one that sticks
+                    first = dict(zip(reversed(self.array), range(n - 1, -1, -1)))
+                    indexes = [first.get(target, -1) for target in targets]
+                except TypeError:
+                    # Unhashable elements or targets, they can still be joined if they're orderable
+                    return self.search_many(targets, "merge")
+            
+            case "merge":
+                values, positions = self._sorted_index()
+                indexes = [-1] * m
+                cursor = 0
+                # Visiting the targets in ascending order, so the cursor into the sorted index only ever moves forward
+                order = range(m)
+                if any(targets[t + 1] < targets[t] for t in range(m - 1)):
+                    order = sorted(order, key=targets.__getitem__)
+                for t in order:
+                    target = targets[t]
+                    cursor = bisect.bisect_left(values, target, cursor)
+                    if cursor < n and values[cursor] == target:
+                        indexes[t] = positions[cursor]
+            
+            case "bisect":
+                values, positions = self._sorted_index()
+                indexes = []
+                for target in targets:
+                    found = bisect.bisect_left(values, target)
+                    indexes.append(positions[found] if found < n and values[found] == target else -1)
+            
+            case "searchsorted" if self.storage == "numpy":
+                probes = numpy.asarray(targets) if m else self.array[:0]
+                if probes.dtype.kind not in "biuf":
+                    # Targets NumPy can't compare as numbers (strs, huge ints, ...)
+                    return self.search_many(targets, "hash")
+                values, positions = self._sorted_index()
+                # All the binary searches in one call; misses past the end are clipped to the last element, which then doesn't match
+                found = numpy.minimum(values.searchsorted(probes), max(n - 1, 0))
+                hit = values[found] == probes if n else numpy.zeros(m, dtype=bool)
+                indexes = numpy.where(hit, positions[found] if n else -1, -1).tolist()
+            
+            case _:
+                raise ValueError(f"Unknown strategy: {strategy}. Use either hash, merge or bisect{', or searchsorted' if self.storage == 'numpy' else ''}.")
+        
+        result = Array(m, int, -1, storage="compact")
+        result.array = py_array.array("q", indexes)
+        self.notify(f"\n✅ Found {m - indexes.count(-1)} of {m} targets ({strategy} strategy).")
+        return result
+    
+    
+    # Aggregates
+    def sum(self):
+        """
+        Returns the sum of the elements of an int/float array
+        """
+        if self.data_type not in utility.TYPECODES:
+            self.fail(TypeError("Only int & float arrays can be summed"), "\n🚫 TypeError(Only int & float arrays can be summed.)")
+            return None
+        if not self._all_set("Sum"):
+            return None
+        if self.storage == "numpy" and not self._sum_may_overflow():
+            total = self.array.sum().item()
+        else:
+            total = sum(self.tolist() if self.storage == "numpy" else self.array, self.data_type())
+        self.notify(f"\n👉 Sum: {total}")
+        return total
+    
+    
+    def _all_set(self, label):
+        """
+        Helper method of the aggregates & range queries, returning True if every element of the array is set, or reporting why they can't run
+        An Array(n, int) starts out with None slots, which can't be added up or compared; the other storages can't hold None at all.
+        """
+        if self.typecode is not None or None not in self.array:
+            return True
+        self.fail(TypeError(f"{label} needs every element of the array set"), f"\n🚫 TypeError({label} needs every element of the array set.)")
+        return False
+    
+    
+    def _sum_may_overflow(self):
+        """
+        Helper method of sum, telling if adding up a numpy int array could leave the int64 range (NumPy would wrap around silently)
+        """
+        if self.data_type is not int or not len(self.array):
+            return False
+        return len(self.array) * max(-self.array.min().item(), self.array.max().item()) >= 2**63
+    
+    
+    def min(self):
+        """
+        Returns the smallest element of the array
+        """
+        return self._extreme(min, "min", "Min")
+    
+    
+    def max(self):
+        """
+        Returns the largest element of the array
+        """
+        return self._extreme(max, "max", "Max")
+    
+    
+    def _extreme(self, builtin, method, label):
+        """
+        Helper method of min & max, running the NumPy reduction or the built-in function
+        """
+        if not len(self.array):
+            self.fail(ValueError(f"{method} of an empty array"), f"\n🚫 ValueError({label} of an empty array.)")
+            return None
+        if not self._all_set(label):
+            return None
+        value = getattr(self.array, method)().item() if self.storage == "numpy" else builtin(self.array)
+        self.notify(f"\n👉 {label}: {value}")
+        return value
+    
+    
+    # Range queries (half-open: the elements at indices l..r-1)
+    def range_sum(self, l, r):
+        """
+        Returns the sum of the elements at indices l..r-1 of an int/float array in O(log n)
+        Uses a Fenwick tree that is built by the first query & kept up to date by insert/remove.
+        """
+        if self.data_type not in utility.TYPECODES:
+            self.fail(TypeError("Only int & float arrays can be summed"), "\n🚫 TypeError(Only int & float arrays can be summed.)")
+            return None
+        if not 0 <= l <= r <= self.size:
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds.)")
+            return None
+        if self._fenwick is None:
+            if not self._all_set("Range sum"):
+                return None
+            self._fenwick = FenwickTree(self.tolist())
+        total = self._fenwick.range_sum(l, r)
+        self.notify(f"\n👉 Sum of [{l}:{r}]: {total}")
+        return total
+    
+    
+    def range_min(self, l, r):
+        """
+        Returns the smallest element at indices l..r-1, in O(log n) or O(1) depending on range_mode
+        """
+        return self._range_extreme(min, l, r, "Min")
+    
+    
+    def range_max(self, l, r):
+        """
+        Returns the largest element at indices l..r-1, in O(log n) or O(1) depending on range_mode
+        """
+        return self._range_extreme(max, l, r, "Max")
+    
+    
+    def _range_extreme(self, func, l, r, label):
+        """
+        Helper method of range_min & range_max, querying (or first building) the segment tree or sparse table of func
+        """
+        if not 0 <= l < r <= self.size:
+            self.fail(IndexError("Array index out of bounds or empty range"), "\n🚫 IndexError(Array index out of bounds or empty range.)")
+            return None
+        key = (self.range_mode, func)
+        table = self._range_tables.get(key)
+        if table is None:
+            if self.range_mode not in ("dynamic", "static"):
+                raise ValueError(f"Unknown range mode: {self.range_mode}. Use either dynamic or static.")
+            if not self._all_set(f"Range {label.lower()}"):
+                return None
+            table = (SegmentTree if self.range_mode == "dynamic" else SparseTable)(self.tolist(), func)
+            self._range_tables[key] = table
+        value = table.query(l, r)
+        self.notify(f"\n👉 {label} of [{l}:{r}]: {value}")
+        return value
     
     
     def size_check(self):
@@ -284,7 +1413,8 @@ class Array:
         Returns the size of the array
         """
         size = self.size
-        print(f"\n👉 Array size: {size}")
+        self.notify(f"\n👉 Array size: {size}")
+        return size
     
     
     def type_check(self):
@@ -292,7 +1422,287 @@ class Array:
         Returns the data type of the array
         """
         data_type = self.data_type.__name__
-        print(f"\n👉 Array Data Type: {data_type}")
+        self.notify(f"\n👉 Array Data Type: {data_type}")
+        return self.data_type
+
+
+
+# 🎯 The MappedArray class
+class MappedArray(Array):
+    def __init__(self, path, data_type, size=None, observer=None, tracer=None):
+        """
+        Opens an int/float array stored in a binary file (8 bytes per element, machine format, e.g. written by Array.tofile)
+        The file is memory-mapped rather than read, so opening is instant & pages are only loaded when touched. Every method of Array works in place on the mapping.
+        With a size, the file is created (or resized) to hold exactly that many elements; without one, an existing file is reopened as is.
+        """
+        if data_type not in utility.TYPECODES:
+            raise TypeError(f"Mapped storage only supports int & float arrays, not {data_type.__name__}.")
+        super().__init__(0, data_type, storage="compact", observer=observer, tracer=tracer)
+        self.storage = "mapped"
+        self.path = path
+        itemsize = py_array.array(self.typecode).itemsize
+        
+        if size is None:
+            self.file = open(path, "r+b")
+            length = os.fstat(self.file.fileno()).st_size
+            if length % itemsize:
+                self.file.close()
+                raise ValueError(f"{path} isn't a {data_type.__name__} array file: its size isn't a multiple of {itemsize} bytes.")
+            size = length // itemsize
+        else:
+            self.file = open(path, "a+b")
+            # Growing the file fills the new elements with zero bytes, i.e. the zero value of both int & float
+            self.file.truncate(size * itemsize)
+        
+        self.size = size
+        # A zero-length file can't be mapped, so an empty array gets an empty buffer instead
+        self.mmap = mmap.mmap(self.file.fileno(), 0) if size else None
+        self.array = memoryview(self.mmap if size else bytearray()).cast(self.typecode)
+    
+    
+    # Array's alternative constructors build the array in memory, which a mapping can't be: the file is the storage
+    @classmethod
+    def from_iterable(cls, *args, **kwargs):
+        """
+        Not supported: a mapped array can't be built in memory from an iterable
+        """
+        raise TypeError("A MappedArray can't be built from an iterable; create it with MappedArray(path, data_type, size) & fill it with extend_into.")
+    
+    
+    @classmethod
+    def from_buffer(cls, *args, **kwargs):
+        """
+        Not supported: a mapped array can't be built in memory from a buffer
+        """
+        raise TypeError("A MappedArray can't be built from a buffer; create it with MappedArray(path, data_type, size) & fill it with extend_into.")
+    
+    
+    @classmethod
+    def from_file(cls, *args, **kwargs):
+        """
+        Not supported: a mapped array can't be built in memory from a file
+        """
+        raise TypeError("A MappedArray isn't loaded from a file, it maps it; open the file with MappedArray(path, data_type).")
+    
+    
+    @classmethod
+    def _wrap(cls, values, data_type, storage, observer, tracer):
+        """
+        Creates a plain in-memory array around a stdlib array of already validated values
+        """
+        return Array._wrap(values, data_type, storage, observer, tracer)
+    
+    
+    def __getitem__(self, key):
+        """
+        Returns an element, or a new in-memory compact array holding the elements of a slice
+        """
+        if isinstance(key, slice):
+            # Copying the slice out of the mapping, so the result outlives close()
+            return self._wrap(py_array.array(self.typecode, self.array[key]), self.data_type, "compact", None, None)
+        return self.array[key]
+    
+    
+    def flush(self):
+        """
+        Writes the modified pages back to the file
+        """
+        if self.mmap is not None:
+            self.mmap.flush()
+    
+    
+    def close(self):
+        """
+        Flushes & unmaps the array; reopen it with MappedArray(path, data_type)
+        """
+        # The memoryview has to let go of the mapping before it can be closed
+        self.array.release()
+        if self.mmap is not None:
+            self.mmap.flush()
+            self.mmap.close()
+        self.file.close()
+    
+    
+    def __enter__(self):
+        return self
+    
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+
+# 🎯 The DynamicArray class
+class DynamicArray(utility.Observable):
+    def __init__(self, data_type, capacity=4, growth_factor=2, storage="list", observer=None):
+        """
+        Initializes a growable array of a data type, with room for capacity elements before the first reallocation
+        size is the allocated capacity (like Array.size) & length the number of elements in use. A full array is reallocated to size * growth_factor slots, which makes append amortized O(1).
+        """
+        if growth_factor <= 1:
+            raise ValueError("The growth factor has to be greater than 1.")
+        if storage == "compact" and data_type not in utility.TYPECODES:
+            raise TypeError(f"Compact storage only supports int & float arrays, not {data_type.__name__}.")
+        if storage not in ("list", "compact"):
+            raise ValueError(f"Unknown storage: {storage}. Use either list or compact.")
+        self.observer = observer
+        self.data_type = data_type
+        self.storage = storage
+        self.typecode = utility.TYPECODES[data_type] if storage == "compact" else None
+        self.growth_factor = growth_factor
+        self.size = capacity
+        self.length = 0
+        self.array = self._allocate(capacity)
+        
+        # Instrumentation for tuning the growth factor: how often the buffer was reallocated & how many elements those reallocations copied
+        self.reallocations = 0
+        self.copied = 0
+    
+    
+    def _allocate(self, capacity):
+        """
+        Returns a new buffer of capacity empty slots
+        """
+        if self.typecode is None:
+            return [None] * capacity
+        return py_array.array(self.typecode, [0]) * capacity
+    
+    
+    def _reallocate(self, capacity):
+        """
+        Moves the elements into a new buffer of the given capacity
+        """
+        buffer = self._allocate(capacity)
+        buffer[:self.length] = self.array[:self.length]
+        self.array = buffer
+        self.size = capacity
+        self.reallocations += 1
+        self.copied += self.length
+    
+    
+    def _grow(self):
+        """
+        Makes room for one more element, growing the buffer geometrically if it's full
+        """
+        if self.length == self.size:
+            self._reallocate(max(self.size + 1, int(self.size * self.growth_factor)))
+    
+    
+    def _accepts(self, value):
+        """
+        Returns True if the value can be stored, or reports why it can't
+        Checked before anything is grown or shifted, so a rejected value leaves the array untouched.
+        """
+        if not isinstance(value, self.data_type):
+            self.fail(TypeError(f"Array can only contain elements of type {self.data_type.__name__}"),
+                      f"\n🚫 TypeError(Array can only contain elements of type {self.data_type.__name__}; item not inserted.)")
+            return False
+        if self.typecode is not None:
+            try:
+                py_array.array(self.typecode, [value])
+            except OverflowError as error:
+                # Compact int arrays hold 64-bit signed integers only
+                self.fail(error, "\n🚫 OverflowError(Value too large for a compact int array; item not inserted.)")
+                return False
+        return True
+    
+    
+    def append(self, value):
+        """
+        Adds an element at the end of the array, in amortized O(1)
+        """
+        if not self._accepts(value):
+            return
+        self._grow()
+        self.array[self.length] = value
+        self.length += 1
+    
+    
+    def insert_at(self, index, value):
+        """
+        Inserts an element at a specific index, shifting the elements from there one slot to the right
+        """
+        if not self._accepts(value):
+            return
+        if not 0 <= index <= self.length:
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds; item not inserted.)")
+            return
+        self._grow()
+        # One slice move instead of shifting the elements one by one
+        self.array[index + 1:self.length + 1] = self.array[index:self.length]
+        self.array[index] = value
+        self.length += 1
+    
+    
+    def pop(self, index=None):
+        """
+        Removes & returns the last element, or the element at a specific index (shifting the elements after it one slot to the left)
+        """
+        if self.length == 0:
+            self.fail(IndexError("pop from empty array"), "\n🚫 IndexError(Array is empty.)")
+            return None
+        if index is None:
+            index = self.length - 1
+        if not 0 <= index < self.length:
+            self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds. Deletion unsuccessful.)")
+            return None
+        value = self.array[index]
+        self.array[index:self.length - 1] = self.array[index + 1:self.length]
+        self.length -= 1
+        # Clearing the vacated slot, so a list buffer doesn't keep the object alive
+        self.array[self.length] = None if self.typecode is None else 0
+        return value
+    
+    
+    def shrink_to_fit(self):
+        """
+        Reallocates the buffer to exactly the number of elements in use
+        """
+        if self.size != self.length:
+            self._reallocate(self.length)
+    
+    
+    def get(self, index):
+        """
+        Returns the element at a specific index
+        """
+        if 0 <= index < self.length:
+            value = self.array[index]
+            self.notify(f"\n👉 {value}")
+            return value
+        self.fail(IndexError("Array index out of bounds"), "\n🚫 IndexError(Array index out of bounds.)")
+    
+    
+    def __len__(self):
+        return self.length
+    
+    
+    def __getitem__(self, index):
+        if not -self.length <= index < self.length:
+            raise IndexError("Array index out of bounds")
+        return self.array[index % self.length]
+    
+    
+    def tolist(self):
+        """
+        Returns the elements in use as a Python list
+        """
+        return list(self.array[:self.length])
+    
+    
+    def size_check(self):
+        """
+        Returns the number of elements in use, with the capacity & reallocation count
+        """
+        self.notify(f"\n👉 Length: {self.length}, capacity: {self.size}, reallocations: {self.reallocations}")
+        return self.length
+    
+    
+    def display(self):
+        """
+        Displays the elements in use
+        """
+        print(f"\n👉 {self.tolist()}")
 
 
 
@@ -330,9 +1740,9 @@ def array_main():
                 
                 # Initializing the array
                 if array_type == "str":
-                    array = Array(array_size, str)
+                    array = Array(array_size, str, observer=print, tracer=SortTracer(print_step, kinds={"step"}))
                 else:
-                    array = Array(array_size, int, 0)
+                    array = Array(array_size, int, 0, observer=print, tracer=SortTracer(print_step, kinds={"step"}))
                 
                 print(f"\n✅️ Here's your {array_type} array.", end="")
                 array.display()
@@ -342,8 +1752,7 @@ def array_main():
             case "2":
                 array_type = "int"
                 array_size = 5
-                array = Array(5, int, 0)
-                array.array = [10, 1987, 672, 8, 2004]
+                array = Array.from_iterable([10, 1987, 672, 8, 2004], int, 0, observer=print, tracer=SortTracer(print_step, kinds={"step"}))
                 print(f"\n✅️ Here's an example int array with size 5.", end="")
                 array.display()
                 break
@@ -402,6 +1811,7 @@ def array_main():
             
             # Filling up the entire array    
             else:
+                items = []
                 for i in range(array.size):
                     item = input(f"\n✍️ Please write the item for index {i}: ")
                     try:
@@ -409,8 +1819,10 @@ def array_main():
                             item = int(item)
                     except ValueError:
                         pass
+                    items.append(item)
                 
-                    array.insert(i, item)
+                # Writing all the items in one go
+                array.extend_into(0, items)
                 array.display()
         
         
@@ -438,6 +1850,10 @@ def array_main():
 ●4) Quick sort
 ●5) Heap sort
 ●6) Shell sort
+●7) Merge sort
+●8) Intro sort
+●9) Radix sort (int arrays)
+●10) Counting sort (int arrays)
 >>> """)
             match sort_alg:
                 ## Bubble sort
@@ -479,7 +1895,7 @@ def array_main():
                 ## Quick sort
                 case "4":
                     sort_order = utility.order_verify()
-                    print("\nℹ️ Quick Sort is an efficient, comparison-based sorting algorithm that uses the divide-and-conquer strategy to sort elements. It works by selecting a ‘pivot’ element from the array and partitioning the other elements into two sub-arrays, according to whether they are less than or greater than the pivot. The sub-arrays are then recursively sorted. This process continues until the base case of an empty or single-element sub-array is reached, which is inherently sorted. Quick Sort has an average and best-case time complexity of O(n log n), making it faster than other O(n^2) algorithms like Bubble Sort and Selection Sort for large datasets. However, its worst-case time complexity is O(n^2), which occurs when the smallest or largest element is always chosen as the pivot. The space complexity of Quick Sort is O(log n) due to the stack space used by the recursive calls. Despite its worst-case scenario, Quick Sort is widely used because of its efficiency and performance in practice.")
+                    print("\nℹ️ Quick Sort is an efficient, comparison-based sorting algorithm that uses the divide-and-conquer strategy to sort elements. It works by selecting a ‘pivot’ element from the array and partitioning the other elements into two sub-arrays, according to whether they are less than or greater than the pivot. The sub-arrays are then recursively sorted. This process continues until the base case of an empty or single-element sub-array is reached, which is inherently sorted. Quick Sort has an average and best-case time complexity of O(n log n), making it faster than other O(n^2) algorithms like Bubble Sort and Selection Sort for large datasets. However, its worst-case time complexity is O(n^2), which occurs when the smallest or largest element is always chosen as the pivot. The space complexity of Quick Sort is O(log n) due to the stack space used by the pending sub-arrays. This program picks the median of three randomly chosen elements as the pivot, which makes the worst case practically impossible whatever the input, groups all the elements equal to the pivot in the middle (three-way partitioning) so duplicate-heavy arrays are sorted quickly, and keeps the pending sub-arrays on an explicit stack instead of making recursive calls. Despite its worst-case scenario, Quick Sort is widely used because of its efficiency and performance in practice.")
                     if sort_order == "asc":
                         array.sort_intro()
                         array.quick_sort("asc")
@@ -512,6 +1928,54 @@ def array_main():
                         array.shell_sort("desc")
                     array.sort_outro()
                 
+                ## Merge sort
+                case "7":
+                    sort_order = utility.order_verify()
+                    print("\nℹ️ Merge Sort is a stable, comparison-based sorting algorithm built on the divide-and-conquer strategy. This bottom-up version needs no recursion: it treats every element as a sorted run of length one, then repeatedly merges neighbouring runs into runs twice as long until a single run covers the whole array. Merging two sorted runs only takes a linear walk over both, always picking the element that comes first, and taking from the left run on ties keeps equal elements in their original order. Merge Sort has a best, average and worst-case time complexity of O(n log n), since there are log n passes of O(n) work each, regardless of the initial order of the elements. Its space complexity is O(n) for the auxiliary buffer the runs are merged into. Merge Sort is the go-to choice when a guaranteed O(n log n) and stability are required, such as sorting records by one key after another.")
+                    if sort_order == "asc":
+                        array.sort_intro()
+                        array.merge_sort("asc")
+                    else:
+                        array.sort_intro()
+                        array.merge_sort("desc")
+                    array.sort_outro()
+                
+                ## Intro sort
+                case "8":
+                    sort_order = utility.order_verify()
+                    print("\nℹ️ Intro Sort (introspective sort) is a hybrid sorting algorithm that combines Quick Sort, Heap Sort and Insertion Sort to get the best of each. It starts as a Quick Sort with a median-of-three pivot, which is fast in practice, while keeping track of the partitioning depth. If the depth exceeds about 2 log n, meaning the pivots keep turning out badly, the offending part is handed over to Heap Sort, capping the worst-case time complexity at O(n log n) instead of Quick Sort's O(n^2). Parts smaller than 16 elements are not partitioned any further; a single Insertion Sort pass at the end finishes them, as Insertion Sort is the fastest on short and nearly sorted runs. Intro Sort has a best, average and worst-case time complexity of O(n log n) and a space complexity of O(log n) for the stack of pending parts. Variants of it are used by the standard libraries of C++ and .NET.")
+                    if sort_order == "asc":
+                        array.sort_intro()
+                        array.intro_sort("asc")
+                    else:
+                        array.sort_intro()
+                        array.intro_sort("desc")
+                    array.sort_outro()
+                
+                ## Radix sort
+                case "9":
+                    sort_order = utility.order_verify()
+                    print("\nℹ️ Radix Sort is a non-comparison sorting algorithm for integers that sorts the numbers digit by digit. The LSD (Least Significant Digit) version implemented here distributes the numbers into buckets by their lowest digit, collects the buckets back in order, and repeats with the next digit until the highest one. Since each distribution is stable, the order established by the lower digits is preserved among numbers sharing the higher digits. This program uses base 256 digits (bytes) and offsets the numbers by the minimum so negative numbers are sorted correctly, too. Radix Sort has a time complexity of O(d * (n + b)), where n is the number of items, d the number of digits and b the base, and a space complexity of O(n + b) for the buckets. For integers of a bounded size it runs in linear time, beating comparison sorts, which cannot do better than O(n log n).")
+                    if sort_order == "asc":
+                        array.sort_intro()
+                        array.radix_sort("asc")
+                    else:
+                        array.sort_intro()
+                        array.radix_sort("desc")
+                    array.sort_outro()
+                
+                ## Counting sort
+                case "10":
+                    sort_order = utility.order_verify()
+                    print("\nℹ️ Counting Sort is a non-comparison sorting algorithm for integers within a known range. It counts how many times each value between the minimum and the maximum occurs in the array, then rewrites the array by walking through the range in order and writing each value as many times as it was counted. Counting Sort has a time complexity of O(n + k), where n is the number of items and k the range of the values, and a space complexity of O(k) for the counts. It is extremely fast when the range is small compared to the number of items, such as ages or exam scores, but impractical for widely spread values, where Radix Sort is the better fit.")
+                    if sort_order == "asc":
+                        array.sort_intro()
+                        array.counting_sort("asc")
+                    else:
+                        array.sort_intro()
+                        array.counting_sort("desc")
+                    array.sort_outro()
+                
                 ## Invalid
                 case _:
                     print("\n🚫 Invalid code number.")
@@ -0,0 +1,516 @@
+# Queue Implementation (static, dynamic-typed)
+# Module is named my_queue to avoid conflict with Python's built-in queue module.
+
+import queue
+import threading
+import time
+
+import utility
+
+
+# 🎯 The Queue class
+class Queue(utility.Observable):
+      
+    def __init__(self, size, observer=None):
+        """
+        Initializes a queue
+        """
+        self.observer = observer
+        self.size = size
+        self.queue = [None] * size
+        self.front = 0
+        self.rear = -1
+        self.length = 0
+
+    def is_empty(self):
+        """
+        Returns True if the queue is empty or false otherwise
+        """
+        return self.length == 0
+
+    def is_full(self):
+        """
+        Returns True if the queue is full or false otherwise
+        """
+        return self.length == self.size
+
+    def size_check(self):
+        """
+        Returns the size of the queue
+        """
+        self.notify(f"\n👉 Queue size: {self.length}/{self.size}")
+        return self.length
+
+    def enqueue(self, item):
+        """
+        Enqueues (inserts) an element to the front of the queue
+        """
+        if not self.is_full():
+            self.rear = (self.rear + 1) % self.size  # wraparound
+            self.queue[self.rear] = item
+            self.length += 1
+        else:
+            self.fail(OverflowError("Queue is full"), "\n🚫 Queue is full; item not enqueued.", end="")
+
+    def dequeue(self):
+        """
+        Dequeues (removes) & returns the element at the front of the queue
+        """
+        if not self.is_empty():
+            item = self.queue[self.front]
+            # Clearing the slot, so the queue doesn't keep the item alive
+            self.queue[self.front] = None
+            self.front = (self.front + 1) % self.size
+            self.length -= 1
+            return item
+        else:
+            self.fail(IndexError("dequeue from empty queue"), "\n🚫 Queue is empty.", end="")
+
+    def get_front(self):
+        """
+        Returns the front of the queue
+        """
+        if not self.is_empty():
+            front = self.queue[self.front]
+            self.notify(f"\n👉 Front item: {front}")
+            return front
+        else:
+            self.fail(IndexError("front of empty queue"), "\n🚫 Queue is empty.")
+
+    def get_rear(self):
+        """
+        Returns the rear of the queue
+        """
+        if not self.is_empty():
+            rear = self.queue[self.rear]
+            self.notify(f"\n👉 Rear item: {rear}")
+            return rear
+        else:
+            self.fail(IndexError("rear of empty queue"), "\n🚫 Queue is empty.")
+
+    def display(self):
+        """
+        Displays the queue
+        """
+        print(f"\n👉 {self.queue}")
+
+
+
+# 🎯 The GrowableQueue class
+class GrowableQueue(Queue):
+    
+    def __init__(self, size=8, observer=None):
+        """
+        Initializes a queue that doubles its capacity instead of refusing items when full
+        The capacity is kept at a power of two, so the wraparound is a bitmask (index & mask) rather than a modulo.
+        """
+        capacity = 1
+        while capacity < size:
+            capacity *= 2
+        super().__init__(capacity, observer)
+        self.mask = capacity - 1
+        self.reallocations = 0
+
+    def is_full(self):
+        """
+        Returns False: a growable queue makes room instead of filling up (its current capacity is size)
+        """
+        return False
+
+    def _grow(self, needed):
+        """
+        Helper method reallocating the ring to the smallest power of two holding needed items, re-linearized so the front lands at index 0
+        """
+        capacity = self.size
+        while capacity < needed:
+            capacity *= 2
+        if capacity == self.size:
+            return
+        ring = self.queue
+        # The items in queue order: from the front to the end of the buffer, then the part that wrapped around
+        items = ring[self.front:self.front + self.length] + ring[:max(0, self.front + self.length - self.size)]
+        self.queue = items + [None] * (capacity - self.length)
+        self.front = 0
+        self.rear = self.length - 1
+        self.size = capacity
+        self.mask = capacity - 1
+        self.reallocations += 1
+
+    def enqueue(self, item):
+        """
+        Enqueues (inserts) an element to the rear of the queue, growing it if it's full
+        """
+        if self.length == self.size:
+            self._grow(self.length + 1)
+        self.rear = (self.rear + 1) & self.mask
+        self.queue[self.rear] = item
+        self.length += 1
+
+    def dequeue(self):
+        """
+        Dequeues (removes) & returns the element at the front of the queue
+        """
+        if not self.length:
+            self.fail(IndexError("dequeue from empty queue"), "\n🚫 Queue is empty.", end="")
+            return None
+        item = self.queue[self.front]
+        self.queue[self.front] = None
+        self.front = (self.front + 1) & self.mask
+        self.length -= 1
+        return item
+
+    def enqueue_many(self, items):
+        """
+        Enqueues a batch of elements, growing the queue at most once & copying them in with at most two slice assignments
+        """
+        items = list(items)
+        count = len(items)
+        if not count:
+            return
+        self._grow(self.length + count)
+        start = (self.rear + 1) & self.mask
+        # The part that fits before the end of the buffer, then the part that wraps around to its start
+        head = min(count, self.size - start)
+        self.queue[start:start + head] = items[:head]
+        self.queue[:count - head] = items[head:]
+        self.rear = (self.rear + count) & self.mask
+        self.length += count
+
+    def dequeue_many(self, count):
+        """
+        Dequeues up to count elements (fewer if the queue runs out) & returns them in queue order
+        """
+        count = max(0, min(count, self.length))
+        start = self.front
+        head = min(count, self.size - start)
+        items = self.queue[start:start + head] + self.queue[:count - head]
+        # Clearing the slots, so the queue doesn't keep the items alive
+        self.queue[start:start + head] = [None] * head
+        self.queue[:count - head] = [None] * (count - head)
+        self.front = (self.front + count) & self.mask
+        self.length -= count
+        return items
+
+
+
+# 🎯 The BlockingQueue class
+class BlockingQueue(Queue):
+    
+    def __init__(self, size, observer=None):
+        """
+        Initializes a bounded queue shared between producer & consumer threads, on the same ring storage as Queue
+        put waits for room (backpressure) & get waits for an item; both take an optional timeout, after which they raise the stdlib queue.Full & queue.Empty. The two conditions share one lock.
+        """
+        super().__init__(size, observer)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    @staticmethod
+    def _wait(condition, blocked, timeout):
+        """
+        Helper method waiting on condition (whose lock is held) while blocked() is true, for at most timeout seconds (None waits forever)
+        Returns False if it timed out still blocked.
+        """
+        if timeout is None:
+            while blocked():
+                condition.wait()
+            return True
+        deadline = time.monotonic() + timeout
+        while blocked():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def put(self, item, timeout=None):
+        """
+        Enqueues an element, waiting for room while the queue is full
+        """
+        with self.lock:
+            put = self._wait(self.not_full, self.is_full, timeout)
+            if put:
+                super().enqueue(item)
+                self.not_empty.notify()
+        if not put:
+            self.fail(queue.Full("Queue stayed full"), f"\n🚫 Queue stayed full for {timeout}s; item not enqueued.", end="")
+
+    def get(self, timeout=None):
+        """
+        Dequeues & returns the element at the front of the queue, waiting for one while the queue is empty
+        """
+        with self.lock:
+            got = self._wait(self.not_empty, self.is_empty, timeout)
+            if got:
+                item = super().dequeue()
+                self.not_full.notify()
+        if not got:
+            self.fail(queue.Empty("Queue stayed empty"), f"\n🚫 Queue stayed empty for {timeout}s.", end="")
+            return None
+        return item
+
+    def get_batch(self, max_n, max_wait=None):
+        """
+        Waits at most max_wait seconds for the queue to have an item, then drains up to max_n items in one go & returns them in queue order
+        One wakeup & one lock acquisition hand a consumer a whole batch, instead of one item each.
+        """
+        with self.lock:
+            got = self._wait(self.not_empty, self.is_empty, max_wait)
+            if got:
+                take = super().dequeue
+                items = [take() for _ in range(min(max_n, self.length))]
+                # Every freed slot can let one waiting producer through
+                self.not_full.notify(len(items))
+        if not got:
+            self.fail(queue.Empty("Queue stayed empty"), f"\n🚫 Queue stayed empty for {max_wait}s.", end="")
+            return []
+        return items
+
+    def enqueue(self, item):
+        """
+        Enqueues (inserts) an element without waiting, failing if the queue is full
+        """
+        with self.lock:
+            enqueued = not self.is_full()
+            if enqueued:
+                super().enqueue(item)
+                self.not_empty.notify()
+        if not enqueued:
+            self.fail(OverflowError("Queue is full"), "\n🚫 Queue is full; item not enqueued.", end="")
+
+    def dequeue(self):
+        """
+        Dequeues (removes) & returns the element at the front of the queue without waiting, failing if the queue is empty
+        """
+        with self.lock:
+            dequeued = not self.is_empty()
+            if dequeued:
+                item = super().dequeue()
+                self.not_full.notify()
+        if not dequeued:
+            self.fail(IndexError("dequeue from empty queue"), "\n🚫 Queue is empty.", end="")
+            return None
+        return item
+
+
+
+# 🎯 The VisualQueue class
+class VisualQueue(Queue):
+    
+    def __init__(self, size, observer=None):
+        """
+        Initializes a queue that displays dequeued items struck out in their slots until they're overwritten, as the interactive menu does
+        The rendering only happens in display, so dequeue stays as fast as Queue's.
+        """
+        super().__init__(size, observer)
+        self.dequeued = {}  # Slot index -> the item last dequeued from it
+
+    def enqueue(self, item):
+        """
+        Enqueues (inserts) an element to the rear of the queue
+        """
+        if not self.is_full():
+            self.dequeued.pop((self.rear + 1) % self.size, None)
+        super().enqueue(item)
+
+    def dequeue(self):
+        """
+        Dequeues (removes) & returns the element at the front of the queue, remembering it for display
+        """
+        if not self.is_empty():
+            self.dequeued[self.front] = self.queue[self.front]
+        return super().dequeue()
+
+    def display(self):
+        """
+        Displays the queue, with the dequeued items struck out
+        """
+        slots = [strikeout(self.dequeued[index]) if index in self.dequeued else item for index, item in enumerate(self.queue)]
+        print(f"\n👉 {slots}")
+
+
+def strikeout(item):
+    """
+    Returns the item as a string with every character struck out
+    """
+    ## Typecasting to str is necessary since int object isn't iterable
+    return "".join(char + "\u0336" for char in str(item))
+
+
+
+# 🎯 The Queue main function
+def queue_main():
+    # Intro
+    queue_intro("full")
+    
+    while True:
+        example = input("""\n🛠️ Do you want to create a queue yourself or use the preloaded example?
+●1) Create a queue
+●2) Use the example
+>>> """)
+        match example:
+            
+            # Create a queue
+            case "1":          
+                # Queue size validation loop
+                while True:
+                    try:
+                        queue_size = int(input("\n↔️ Please specify the size of the queue.\n>>> "))
+                    except ValueError:
+                        print("\n❌ Invalid, the size can only be an integer!️")
+                        continue
+                    else:
+                        break
+            
+                # Initializing & displaying the queue
+                queue = VisualQueue(queue_size, observer=print)
+                print("\n✅ Here's your queue:", end="")
+                queue.display()
+                break
+            
+            # Use the example
+            case "2":
+                queue = VisualQueue(5, observer=print)
+                print("\n✅ Here's an example queue with size 5:", end="")
+                queue.display()
+                break
+            
+            # Invalid
+            case _:
+                print("\n❌ Invalid code number!")
+                continue
+
+
+    # 🟢 Operation selection loop
+    while True:
+        
+        opr = input("""\n⚔️ Which operation do you want to perform with the QUEUE?
+★0) Definition
+★1) Enqueue
+★2) Dequeue
+★3) Front
+★4) Rear
+★5) isEmpty
+★6) isFull
+★7) Size Check
+★8) Displaying
+★9) New Queue
+★10) New Data Structure
+★11) Exit the Program
+
+>>> """)
+
+        match opr:
+            
+            # Definition
+            case "0":
+                queue_intro("def")
+            
+            # Enqueue
+            case "1":
+                item = input("\n✍️ Please write the item.\n>>> ")
+                
+                try:
+                    item = int(item)
+                except ValueError:
+                    pass
+                else:
+                    type = input("\n🤔 Do you want to add the item as an int or str? Type 1 for int or anything else for str.\n>>> ")
+                    if type == "1":
+                        pass
+                    else:
+                        item = str(item)
+                queue.enqueue(item)
+                queue.display()
+
+
+            # Dequeue
+            case "2":
+                queue.dequeue()
+                queue.display()
+            
+            
+            # Front
+            case "3":
+                queue.get_front()
+            
+            
+            # Rear
+            case "4":
+                queue.get_rear()
+            
+            
+            # isEmpty
+            case "5":
+                result = queue.is_empty()
+                print(f"\n👉 isEmpty: {result}.")
+            
+            
+            # isFull
+            case "6":
+                result = queue.is_full()
+                print(f"\n👉 isFull: {result}.")
+            
+            
+            # Size Check
+            case "7":
+                queue.size_check()
+            
+            
+            # Displaying
+            case "8":
+                queue.display()
+            
+            
+            # New Queue
+            case "9":
+                utility.clear()
+                utility.main_intro()
+                queue_main()
+                break
+            
+            
+            # New Data Structure
+            case "10":
+                utility.clear()
+                utility.main_intro()
+                break
+            
+            
+            # Exit the Program
+            case "11":
+                exit()
+            
+            
+            # Invalid
+            case _:
+                print("\n🚫 Invalid operation code!")
+                ## Auto continue with the While True in full swing!
+
+
+# 🎁 Queue intro function
+def queue_intro(condition):
+    queue_ascii = """\n
+    ,-----.      ___    _     .-''-.    ___    _     .-''-.   
+  .'  .-,  '.  .'   |  | |  .'_ _   \ .'   |  | |  .'_ _   \  
+ / ,-.|  \ _ \ |   .'  | | / ( ` )   '|   .'  | | / ( ` )   ' 
+;  \  '_ /  | :.'  '_  | |. (_ o _)  |.'  '_  | |. (_ o _)  | 
+|  _`,/ \ _/  |'   ( \.-.||  (_,_)___|'   ( \.-.||  (_,_)___| 
+: (  '\_/ \   ;' (`. _` /|'  \   .---.' (`. _` /|'  \   .---. 
+ \ `"/  \  )  \| (_ (_) _) \  `-'    /| (_ (_) _) \  `-'    / 
+  '. \_/``"/)  )\ /  . \ /  \       /  \ /  . \ /  \       /  
+    '-----' `-'  ``-'`-''    `'-..-'    ``-'`-''    `'-..-'\n"""
+    
+    queue_def = "\n🎯 A queue is a linear data structure that adheres to the First In, First Out (FIFO) principle, much like customers waiting in line where the first person in line is the first to be served. It supports two primary operations: enqueue, which adds an element to the end of the queue, and dequeue, which removes the element from the front. This structure is essential in various computing scenarios, such as task scheduling, data processing, and resource management, due to its ability to maintain order in processing tasks or data. Queues are implemented in software using arrays or linked lists and are integral in algorithms that require sequential data processing, ensuring that elements are handled in the exact order they were added. This program implements a dynamic-typed, fixed-size queue."
+    
+    if condition == "full":
+        print(queue_ascii)
+        print(queue_def)
+    elif condition == "def":
+        print(queue_def)
+
+
+# 🎯 Calling the Queue main function
+if __name__ == "__main__":
+    queue_main()
@@ -1,30 +1,37 @@
 # Stack Implementation (static, dynamic-typed)
 
+import array as py_array
+import asyncio
+import collections
+import pickle
+import tempfile
+import threading
+
 import utility
 
 
 # 🎯 The Stack class
-class Stack:
+class Stack(utility.Observable):
     
-    def __init__(self, size):
+    def __init__(self, size, observer=None):
         """
         Initializes a stack
         """
+        self.observer = observer
         self.size = size
         self.stack = []
-        self.top = -1
 
     def is_empty(self):
         """
         Returns True if the stack is empty or false otherwise
         """
-        return self.top == -1
+        return not self.stack
 
     def is_full(self):
         """
         Returns True if the stack is full or false otherwise
         """
-        return self.top == self.size - 1
+        return len(self.stack) >= self.size
 
     def push(self, item):
         """
@@ -32,9 +39,8 @@ class Stack:
         """
         if not self.is_full():
             self.stack.append(item)
-            self.top += 1
         else:
-            print("\n🚫 Stack is full; item not pushed.", end="")
+            self.fail(OverflowError("Stack is full"), "\n🚫 Stack is full; item not pushed.", end="")
 
     def pop(self):
         """
@@ -42,26 +48,29 @@ class Stack:
         """
         if not self.is_empty():
             item = self.stack.pop()
-            self.top -= 1
-            print(f"\n👋 Item removed: {item}", end="")
+            self.notify(f"\n👋 Item removed: {item}", end="")
+            return item
         else:
-            print("\n🚫 Stack is empty.", end="")
+            self.fail(IndexError("pop from empty stack"), "\n🚫 Stack is empty.", end="")
 
     def peek(self):
         """
         Returns the element at the top of the stack
         """
         if not self.is_empty():
-            top = self.stack[self.top]
-            print(f"\n👉 Top item: {top}")
+            top = self.stack[-1]
+            self.notify(f"\n👉 Top item: {top}")
+            return top
         else:
-            print("\n🚫 Stack is empty.")
+            self.fail(IndexError("peek from empty stack"), "\n🚫 Stack is empty.")
     
     def size_check(self):
         """
         Returns the size of the stack
         """
-        print(f"\n👉 Stack size: {len(self.stack)}/{self.size}")
+        length = len(self.stack)
+        self.notify(f"\n👉 Stack size: {length}/{self.size}")
+        return length
        
     def display(self):
         """
@@ -71,6 +80,574 @@ class Stack:
 
 
 
+# 🎯 The ThreadSafeStack class
+class ThreadSafeStack(Stack):
+    
+    def __init__(self, size, observer=None):
+        """
+        Initializes a stack that can be shared between threads, e.g. as a free list
+        Every check-then-act sequence runs under one lock, held only for the list operation itself (never while notifying the observer). push_many & pop_many move a whole batch per lock acquisition.
+        """
+        super().__init__(size, observer)
+        self.lock = threading.Lock()
+
+    def push(self, item):
+        """
+        Pushes (inserts) an element into the stack
+        """
+        with self.lock:
+            pushed = len(self.stack) < self.size
+            if pushed:
+                self.stack.append(item)
+        if not pushed:
+            self.fail(OverflowError("Stack is full"), "\n🚫 Stack is full; item not pushed.", end="")
+
+    def pop(self):
+        """
+        Pops (removes) & returns the element from the top of the stack
+        """
+        with self.lock:
+            popped = bool(self.stack)
+            if popped:
+                item = self.stack.pop()
+        if not popped:
+            self.fail(IndexError("pop from empty stack"), "\n🚫 Stack is empty.", end="")
+            return None
+        self.notify(f"\n👋 Item removed: {item}", end="")
+        return item
+
+    def peek(self):
+        """
+        Returns the element at the top of the stack
+        """
+        with self.lock:
+            empty = not self.stack
+            top = None if empty else self.stack[-1]
+        if empty:
+            self.fail(IndexError("peek from empty stack"), "\n🚫 Stack is empty.")
+            return None
+        self.notify(f"\n👉 Top item: {top}")
+        return top
+
+    def push_many(self, items):
+        """
+        Pushes a batch of elements (the last one ending up on top) under a single lock acquisition
+        All or nothing: if the batch doesn't fit, none of it is pushed.
+        """
+        items = list(items)
+        with self.lock:
+            pushed = len(self.stack) + len(items) <= self.size
+            if pushed:
+                self.stack.extend(items)
+        if not pushed:
+            self.fail(OverflowError("Stack is full"), f"\n🚫 Not enough room in the stack for {len(items)} items; none pushed.", end="")
+
+    def pop_many(self, count):
+        """
+        Pops up to count elements under a single lock acquisition & returns them, top first
+        Returns fewer (or none) if the stack runs out, rather than failing.
+        """
+        with self.lock:
+            batch = self.stack[:-count - 1:-1] if count > 0 else []
+            del self.stack[len(self.stack) - len(batch):]
+        return batch
+
+
+
+# 🎯 The CompactStack class
+class CompactStack(Stack):
+    
+    def __init__(self, size, data_type=int, observer=None):
+        """
+        Initializes a stack of int or float elements, kept unboxed in a stdlib array (8 bytes each) instead of a list of Python objects
+        Besides the memory, the elements aren't objects the garbage collector has to track.
+        """
+        if data_type not in utility.TYPECODES:
+            raise TypeError(f"CompactStack only supports int & float elements, not {data_type.__name__}.")
+        super().__init__(size, observer)
+        self.data_type = data_type
+        self.stack = py_array.array(utility.TYPECODES[data_type])
+
+    def push(self, item):
+        """
+        Pushes (inserts) an int/float element into the stack
+        """
+        if not isinstance(item, self.data_type):
+            self.fail(TypeError(f"Stack can only contain elements of type {self.data_type.__name__}"),
+                      f"\n🚫 TypeError(Stack can only contain elements of type {self.data_type.__name__}; item not pushed.)", end="")
+        elif len(self.stack) >= self.size:
+            self.fail(OverflowError("Stack is full"), "\n🚫 Stack is full; item not pushed.", end="")
+        else:
+            try:
+                self.stack.append(item)
+            except OverflowError as error:
+                self.fail(error, "\n🚫 OverflowError(Value too large for a compact int stack; item not pushed.)", end="")
+
+    def display(self):
+        """
+        Displays the stack
+        """
+        print(f"\n👉 {self.stack.tolist()}")
+
+
+
+# 🎯 The MinMaxStack class
+class MinMaxStack(Stack):
+    
+    def __init__(self, size, observer=None):
+        """
+        Initializes a stack of numbers that answers min, max & sum in O(1)
+        Every level of the stack records the min, max & sum of the elements up to it, so popping simply uncovers the aggregates of the level below.
+        """
+        super().__init__(size, observer)
+        self.aggregates = []
+
+    def push(self, item):
+        """
+        Pushes (inserts) a number into the stack
+        """
+        if self.is_full():
+            self.fail(OverflowError("Stack is full"), "\n🚫 Stack is full; item not pushed.", end="")
+            return
+        try:
+            if self.aggregates:
+                low, high, total = self.aggregates[-1]
+                aggregate = (min(low, item), max(high, item), total + item)
+            else:
+                aggregate = (item, item, 0 + item)
+        except TypeError as error:
+            self.fail(error, "\n🚫 TypeError(MinMaxStack only holds numbers; item not pushed.)", end="")
+            return
+        self.stack.append(item)
+        self.aggregates.append(aggregate)
+
+    def pop(self):
+        """
+        Pops (removes) & returns the element from the top of the stack, along with its aggregates
+        """
+        if self.aggregates:
+            self.aggregates.pop()
+        return super().pop()
+
+    def min(self):
+        """
+        Returns the smallest element in the stack
+        """
+        return self._aggregate(0, "min", "Min")
+
+    def max(self):
+        """
+        Returns the largest element in the stack
+        """
+        return self._aggregate(1, "max", "Max")
+
+    def sum(self):
+        """
+        Returns the sum of the elements in the stack
+        """
+        if not self.aggregates:
+            return 0
+        return self._aggregate(2, "sum", "Sum")
+
+    def _aggregate(self, position, name, label):
+        """
+        Helper method returning one of the aggregates of the top level
+        """
+        if not self.aggregates:
+            self.fail(ValueError(f"{name} of an empty stack"), f"\n🚫 ValueError({label} of an empty stack.)")
+            return None
+        value = self.aggregates[-1][position]
+        self.notify(f"\n👉 {label}: {value}")
+        return value
+
+
+
+# 🎯 The AsyncStack class
+class AsyncStack(Stack):
+    
+    def __init__(self, size, observer=None):
+        """
+        Initializes a bounded stack for asyncio code, where push waits for room & pop waits for an item instead of failing
+        asyncio runs one coroutine at a time, so nothing needs locking: a coroutine that has to wait parks on a future, & every push (or pop) wakes up one waiting consumer (or producer).
+        """
+        super().__init__(size, observer)
+        self.putters = collections.deque()
+        self.getters = collections.deque()
+
+    async def push(self, item, timeout=None):
+        """
+        Pushes (inserts) an element into the stack, waiting up to timeout seconds (forever by default) for room
+        """
+        # Only waiting (& paying for the timeout machinery) when there's no room right away
+        if self.is_full():
+            try:
+                await self._wait(self.putters, self.is_full, timeout)
+            except TimeoutError:
+                self.fail(TimeoutError("Stack stayed full"), f"\n🚫 Stack stayed full for {timeout}s; item not pushed.", end="")
+                return
+        self.stack.append(item)
+        self._wake(self.getters)
+
+    async def pop(self, timeout=None):
+        """
+        Pops (removes) & returns the element from the top of the stack, waiting up to timeout seconds (forever by default) for one
+        """
+        if self.is_empty():
+            try:
+                await self._wait(self.getters, self.is_empty, timeout)
+            except TimeoutError:
+                self.fail(TimeoutError("Stack stayed empty"), f"\n🚫 Stack stayed empty for {timeout}s.", end="")
+                return None
+        item = self.stack.pop()
+        self._wake(self.putters)
+        self.notify(f"\n👋 Item removed: {item}", end="")
+        return item
+
+    async def _wait(self, waiters, blocked, timeout):
+        """
+        Helper method waiting in line until blocked() turns false, or raising TimeoutError after timeout seconds
+        """
+        # Awaited directly rather than through asyncio.wait_for, which would run it as a separate task: the caller then resumes right as blocked() turned false, before any other coroutine can take the item (or the room)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while blocked():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            timer = None if deadline is None else loop.call_at(deadline, self._expire, waiter)
+            try:
+                await waiter
+            except BaseException:
+                # Timed out or cancelled: leaving the line, & passing the wakeup on if one had already arrived
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                elif not blocked():
+                    self._wake(waiters)
+                raise
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+    @staticmethod
+    def _expire(waiter):
+        if not waiter.done():
+            waiter.set_exception(TimeoutError())
+
+    def _wake(self, waiters):
+        """
+        Helper method waking up the first coroutine still waiting in line
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+
+
+# 🎯 The SpillStack class
+class SpillStack(Stack):
+    
+    def __init__(self, size, resident=4096, page_size=1024, temp_dir=None, observer=None):
+        """
+        Initializes a stack that keeps at most resident items in memory & spills the older ones to a temporary file, page_size items at a time
+        The pages on disk are themselves a stack: the newest one is reloaded (& cut off the end of the file) once the items in memory run out.
+        """
+        if not 0 < page_size <= resident:
+            raise ValueError("The page size has to be between 1 & the number of resident items.")
+        super().__init__(size, observer)
+        self.resident = resident
+        self.page_size = page_size
+        self.temp_dir = temp_dir
+        self.file = None
+        self.pages = []  # File offsets of the spilled pages, oldest first
+        self.spilled = 0  # Items currently on disk
+        
+        # Metrics
+        self.spills = 0
+        self.reloads = 0
+
+    def __len__(self):
+        return len(self.stack) + self.spilled
+
+    def is_empty(self):
+        """
+        Returns True if the stack is empty or false otherwise
+        """
+        return not self.stack and not self.pages
+
+    def is_full(self):
+        """
+        Returns True if the stack is full or false otherwise
+        """
+        return len(self) >= self.size
+
+    def push(self, item):
+        """
+        Pushes (inserts) an element into the stack, spilling the oldest page in memory once there are too many
+        """
+        super().push(item)
+        if len(self.stack) > self.resident:
+            try:
+                self._spill()
+            except (pickle.PicklingError, TypeError, AttributeError) as error:
+                # The page couldn't be written, so the push is undone rather than letting memory grow past resident
+                self.stack.pop()
+                self.fail(error, f"\n🚫 Can't spill the oldest items to disk ({error}); item not pushed.", end="")
+
+    def pop(self):
+        """
+        Pops (removes) & returns the element from the top of the stack, reloading a page first if none are left in memory
+        """
+        if not self.stack and self.pages:
+            self._reload()
+        return super().pop()
+
+    def peek(self):
+        """
+        Returns the element at the top of the stack
+        """
+        if not self.stack and self.pages:
+            self._reload()
+        return super().peek()
+
+    def size_check(self):
+        """
+        Returns the size of the stack
+        """
+        length = len(self)
+        self.notify(f"\n👉 Stack size: {length}/{self.size} ({len(self.stack)} in memory, {self.spilled} on disk)")
+        return length
+
+    def display(self):
+        """
+        Displays the items in memory (the ones on disk stay there)
+        """
+        print(f"\n👉 {'[... ' + str(self.spilled) + ' items on disk] + ' if self.spilled else ''}{self.stack}")
+
+    def _spill(self):
+        """
+        Helper method writing the oldest page of the items in memory to the end of the file
+        If the page can't be pickled, the error propagates with the stack left unchanged.
+        """
+        page = self.stack[:self.page_size]
+        # Serializing first: the items only leave memory once their bytes exist
+        data = pickle.dumps(page, pickle.HIGHEST_PROTOCOL)
+        if self.file is None:
+            self.file = tempfile.TemporaryFile(dir=self.temp_dir)
+        self.file.seek(0, 2)
+        offset = self.file.tell()
+        self.file.write(data)
+        del self.stack[:self.page_size]
+        self.pages.append(offset)
+        self.spilled += len(page)
+        self.spills += 1
+
+    def _reload(self):
+        """
+        Helper method reading the newest page back from the end of the file & truncating it
+        """
+        offset = self.pages.pop()
+        self.file.seek(offset)
+        page = pickle.load(self.file)
+        self.file.truncate(offset)
+        self.stack[:0] = page
+        self.spilled -= len(page)
+        self.reloads += 1
+
+    def close(self):
+        """
+        Deletes the spill file
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.stack.clear()
+        self.pages.clear()
+        self.spilled = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+
+# 🎯 The PersistentStack class
+class PersistentStack(utility.Observable):
+    
+    def __init__(self, size, observer=None, cell=None, length=0):
+        """
+        Initializes an immutable stack: push & pop leave it untouched & return a new version instead
+        The items are kept in cons cells (item, rest): a new version is a new cell pointing to the old ones, so versions share everything below their top & both operations are O(1).
+        """
+        self.observer = observer
+        self.size = size
+        self.cell = cell
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """
+        Yields the items from the top down
+        """
+        cell = self.cell
+        while cell is not None:
+            item, cell = cell
+            yield item
+
+    def is_empty(self):
+        """
+        Returns True if the stack is empty or false otherwise
+        """
+        return self.cell is None
+
+    def is_full(self):
+        """
+        Returns True if the stack is full or false otherwise
+        """
+        return self.length >= self.size
+
+    def push(self, item):
+        """
+        Returns a new version of the stack with the item on top
+        """
+        if self.is_full():
+            self.fail(OverflowError("Stack is full"), "\n🚫 Stack is full; item not pushed.", end="")
+            return self
+        return PersistentStack(self.size, self.observer, (item, self.cell), self.length + 1)
+
+    def pop(self):
+        """
+        Returns a new version of the stack without its top item (read it with peek first)
+        """
+        if self.is_empty():
+            self.fail(IndexError("pop from empty stack"), "\n🚫 Stack is empty.", end="")
+            return self
+        return PersistentStack(self.size, self.observer, self.cell[1], self.length - 1)
+
+    def peek(self):
+        """
+        Returns the element at the top of the stack
+        """
+        if self.is_empty():
+            self.fail(IndexError("peek from empty stack"), "\n🚫 Stack is empty.")
+            return None
+        top = self.cell[0]
+        self.notify(f"\n👉 Top item: {top}")
+        return top
+
+    def tolist(self):
+        """
+        Returns the items as a list, bottom first like Stack.stack
+        """
+        return list(self)[::-1]
+
+    def display(self):
+        """
+        Displays the stack
+        """
+        print(f"\n👉 {self.tolist()}")
+
+
+
+# 🎯 The SnapshotStack class
+class SnapshotStack(Stack):
+    
+    def __init__(self, size, observer=None):
+        """
+        Initializes a mutable stack that can be snapshotted & restored in O(1)
+        It's a PersistentStack under the hood: a snapshot is simply the current version, which no later push or pop can alter.
+        """
+        super().__init__(size, observer)
+        self.version = PersistentStack(size)
+
+    @property
+    def stack(self):
+        """
+        The items as a list, bottom first (built on demand, in O(n))
+        """
+        return self.version.tolist()
+
+    @stack.setter
+    def stack(self, items):
+        version = PersistentStack(self.size)
+        for item in items:
+            version = version.push(item)
+        self.version = version
+
+    def __len__(self):
+        return len(self.version)
+
+    def is_empty(self):
+        """
+        Returns True if the stack is empty or false otherwise
+        """
+        return self.version.is_empty()
+
+    def is_full(self):
+        """
+        Returns True if the stack is full or false otherwise
+        """
+        return len(self.version) >= self.size
+
+    def push(self, item):
+        """
+        Pushes (inserts) an element into the stack
+        """
+        if self.is_full():
+            self.fail(OverflowError("Stack is full"), "\n🚫 Stack is full; item not pushed.", end="")
+            return
+        self.version = self.version.push(item)
+
+    def pop(self):
+        """
+        Pops (removes) & returns the element from the top of the stack
+        """
+        if self.is_empty():
+            self.fail(IndexError("pop from empty stack"), "\n🚫 Stack is empty.", end="")
+            return None
+        item = self.version.cell[0]
+        self.version = self.version.pop()
+        self.notify(f"\n👋 Item removed: {item}", end="")
+        return item
+
+    def peek(self):
+        """
+        Returns the element at the top of the stack
+        """
+        if self.is_empty():
+            self.fail(IndexError("peek from empty stack"), "\n🚫 Stack is empty.")
+            return None
+        top = self.version.cell[0]
+        self.notify(f"\n👉 Top item: {top}")
+        return top
+
+    def size_check(self):
+        """
+        Returns the size of the stack
+        """
+        length = len(self.version)
+        self.notify(f"\n👉 Stack size: {length}/{self.size}")
+        return length
+
+    def snapshot(self):
+        """
+        Returns the current state of the stack as an immutable PersistentStack, in O(1)
+        """
+        return self.version
+
+    def restore(self, snapshot):
+        """
+        Puts the stack back in the state of a snapshot, in O(1)
+        The snapshot may come from a stack of another size, so its cells are rewrapped in a version bound by this stack's own size.
+        """
+        self.version = PersistentStack(self.size, self.version.observer, snapshot.cell, len(snapshot))
+
+
+
 # 🎯 The Stack main function
 def stack_main():
     # Intro
@@ -97,14 +674,14 @@ def stack_main():
                         break
                 
                 # Initializing & displaying the stack
-                stack = Stack(stack_size)
+                stack = Stack(stack_size, observer=print)
                 print("\n✅ Here's your stack:", end="")
                 stack.display()
                 break
             
             # Use the example
             case "2":
-                stack = Stack(5)
+                stack = Stack(5, observer=print)
                 print("\n✅ Here's an example stack with size 5:", end="")
                 stack.push(10)
                 stack.push("Messi")
@@ -0,0 +1,129 @@
+# Parity tests for the Array storage engines: list, compact & numpy have to give the same answers, as the same Python types
+# Run them with `python -m unittest test_my_array` (or pytest); the numpy storage tests are skipped when NumPy isn't installed.
+
+import unittest
+
+import my_array
+
+
+# Boundary values of each data type, duplicates included so the searches have a first occurrence to find
+BOUNDARIES = {
+    int: [2**63 - 1, -2**63, 0, -1, 1, 2**62, -2**62, 2**31, -2**31, 7, 7],
+    float: [1.7976931348623157e308, -1.7976931348623157e308, 5e-324, -0.0, 0.0, 1.5, -2.25, 1e-300, 3.0, 3.0],
+}
+STORAGES = ("list", "compact", "numpy")
+SORTS = ("sort", "bubble_sort", "selection_sort", "insertion_sort", "quick_sort", "heap_sort", "shell_sort", "merge_sort", "intro_sort")
+INT_SORTS = ("radix_sort", "counting_sort")
+
+
+def types_of(value):
+    """
+    Returns the types inside a (possibly nested) result, for comparing results beyond ==
+    """
+    if isinstance(value, (list, tuple)):
+        return [types_of(item) for item in value]
+    return type(value)
+
+
+@unittest.skipIf(my_array.numpy is None, "NumPy isn't installed")
+class ArrayParityTest(unittest.TestCase):
+
+    def assertParity(self, data_type, operation):
+        """
+        Runs operation on a fresh array of every storage & checks they all agree with the list storage, values & types
+        """
+        expected = None
+        for storage in STORAGES:
+            array = my_array.Array.from_iterable(BOUNDARIES[data_type], data_type, storage=storage)
+            result = operation(array)
+            if expected is None:
+                expected = result
+                continue
+            with self.subTest(data_type=data_type.__name__, storage=storage):
+                self.assertEqual(result, expected)
+                self.assertEqual(types_of(result), types_of(expected))
+
+    def test_access(self):
+        for data_type in (int, float):
+            n = len(BOUNDARIES[data_type])
+            self.assertParity(data_type, lambda array: [array.get(i) for i in range(n)])
+            self.assertParity(data_type, lambda array: [array[i] for i in range(-n, n)])
+            self.assertParity(data_type, lambda array: array[2:8].tolist())
+            self.assertParity(data_type, lambda array: array.tolist())
+
+    def test_aggregates(self):
+        for data_type in (int, float):
+            self.assertParity(data_type, lambda array: (array.sum(), array.min(), array.max()))
+
+    def test_sum_past_int64(self):
+        for storage in STORAGES:
+            with self.subTest(storage=storage):
+                self.assertEqual(my_array.Array.from_iterable([2**62] * 4, int, storage=storage).sum(), 2**64)
+                self.assertEqual(my_array.Array.from_iterable([-2**63] * 3, int, storage=storage).sum(), -3 * 2**63)
+
+    def test_searches(self):
+        for data_type in (int, float):
+            targets = BOUNDARIES[data_type] + [data_type(12345)]
+            self.assertParity(data_type, lambda array: [array.linear_search(target) for target in targets])
+            self.assertParity(data_type, lambda array: [array.binary_search(target) for target in targets])
+            self.assertParity(data_type, lambda array: array.search_many(targets).tolist())
+
+    def test_sorts(self):
+        for data_type in (int, float):
+            for algorithm in SORTS:
+                for order in ("asc", "desc"):
+                    def run(array):
+                        method = getattr(array, algorithm)
+                        method() if algorithm == "sort" else method(order)
+                        return array.tolist()
+                    self.assertParity(data_type, run)
+
+    def test_int_sorts(self):
+        for algorithm in INT_SORTS:
+            for order in ("asc", "desc"):
+                self.assertParity(int, lambda array: (getattr(array, algorithm)(order), array.tolist())[1])
+
+    def test_selection(self):
+        for data_type in (int, float):
+            n = len(BOUNDARIES[data_type])
+            for order in ("asc", "desc"):
+                self.assertParity(data_type, lambda array: [array.select(k, order) for k in range(n)])
+                self.assertParity(data_type, lambda array: array.top_k(4, order).tolist())
+                self.assertParity(data_type, lambda array: (array.partial_sort(4, order), array.tolist()[:4])[1])
+
+    def test_range_queries(self):
+        for data_type in (int, float):
+            n = len(BOUNDARIES[data_type])
+            ranges = [(l, r) for l in range(n) for r in range(l + 1, n + 1)]
+            for mode in ("dynamic", "static"):
+                def run(array):
+                    array.range_mode = mode
+                    return [(array.range_sum(l, r), array.range_min(l, r), array.range_max(l, r)) for l, r in ranges]
+                self.assertParity(data_type, run)
+
+    def test_range_queries_after_writes(self):
+        for data_type in (int, float):
+            n = len(BOUNDARIES[data_type])
+            def run(array):
+                # Building the indexes first, so the writes go through their incremental updates
+                array.range_sum(0, n), array.range_min(0, n)
+                array.insert(1, data_type(5))
+                array.insert(n - 1, BOUNDARIES[data_type][0])
+                return [(array.range_sum(l, n), array.range_min(l, n)) for l in range(n)]
+            self.assertParity(data_type, run)
+
+
+
+class ArrayUnsetElementsTest(unittest.TestCase):
+
+    def test_aggregates_need_every_element_set(self):
+        # An Array(n, int) starts out with None slots
+        array = my_array.Array(4, int)
+        array.insert(0, 1)
+        for operation in (array.sum, array.min, array.max, lambda: array.range_sum(0, 2), lambda: array.range_min(0, 2), lambda: array.range_max(0, 2)):
+            with self.assertRaisesRegex(TypeError, "every element of the array set"):
+                operation()
+
+
+if __name__ == "__main__":
+    unittest.main()
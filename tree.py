@@ -220,9 +220,8 @@ def bst_main():
                 
                 if item != None:
                     # When we get a valid input to consider for deleting
-                    # Collecting all the nodes in the tree through inorder traversal to check if the input item is available in the tree & print node not found when negative.
-                    nodes = bst.inorder()
-                    if item not in nodes:
+                    # Searching the tree (O(log n) on a balanced tree, rather than collecting all the nodes through an inorder traversal) to check if the input item is available & print node not found when negative.
+                    if bst.search(item) is None:
                         print("\n❌ Node not found. Deletion unsuccessful.")
                     else:
                         bst.delete(item)
@@ -596,9 +595,8 @@ def avl_main():
                 
                 if item != None:
                     # When we get a valid input to consider for deleting
-                    # Collecting all the nodes in the tree through inorder traversal to check if the input item is available in the tree & print node not found when negative.
-                    nodes = avl.inorder()
-                    if item not in nodes:
+                    # Searching the tree (O(log n) on a balanced tree, rather than collecting all the nodes through an inorder traversal) to check if the input item is available & print node not found when negative.
+                    if avl.search(item) is None:
                         print("\n❌ Node not found. Deletion unsuccessful.")
                     else:
                         avl.delete(item)
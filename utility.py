@@ -1,6 +1,32 @@
 import os
 
 
+# 🎁 Library mode shared by all the data structure classes
+## The classes are silent by default: their methods return values & raise exceptions. The interactive *_main functions attach print as the observer to get the console feedback, in which case errors are reported to the observer instead of being raised.
+class Observable:
+    observer = None
+
+    def notify(self, message, end="\n"):
+        """
+        Sends a feedback message to the observer, if any
+        """
+        if self.observer is not None:
+            self.observer(message, end=end)
+
+    def fail(self, error, message, end="\n"):
+        """
+        Reports an error to the observer, or raises it when there's none (library mode)
+        """
+        if self.observer is None:
+            raise error
+        self.observer(message, end=end)
+
+
+# 🎁 Typecodes of the stdlib array module for the numeric data types, shared by the compact storages (Array, DynamicArray & CompactStack)
+## "q" holds 64-bit signed integers only: storing a bigger int raises OverflowError.
+TYPECODES = {int: "q", float: "d"}
+
+
 def clear():
     # for Windows
     if os.name == 'nt':